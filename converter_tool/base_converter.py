@@ -4,18 +4,171 @@ Base converter class that all format-specific converters inherit from.
 
 import json
 import logging
+import os
+import re
+import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
 
-from .utils import extract_metadata
+from .utils import (
+    DEFAULT_HASH_ALGORITHMS,
+    IO_BUFFER_SIZE,
+    calculate_hashes_bytes,
+    detect_file_type_bytes,
+    extract_metadata,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def decode_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_json(data: Any, pretty: bool = True,
+                 default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, with orjson when available.
+    
+    Args:
+        data: Data to serialize
+        pretty: Whether to pretty-print with 2-space indentation
+        default: Hook for types neither encoder handles natively
+            (IncrementalJSONList is expanded to a list if not given)
+            
+    Returns:
+        JSON document as bytes
+    """
+    default = default or _expand_incremental
+    
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(data, default=default, option=option)
+        except TypeError as e:
+            # e.g. integers beyond 64 bits
+            logger.debug(f"orjson could not serialize data ({e}), using json")
+    
+    if pretty:
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=default)
+    else:
+        text = json.dumps(data, ensure_ascii=False, default=default, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+def _expand_incremental(obj: Any) -> Any:
+    """JSON default hook that encodes a nested IncrementalJSONList as a plain list."""
+    if isinstance(obj, IncrementalJSONList):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class IncrementalJSONList:
+    """
+    List whose items are JSON-encoded as soon as they are appended.
+    
+    Converters that produce very large arrays (EVTX records, archive listings)
+    fill one of these instead of a list, so only the encoded bytes are kept and
+    save_json streams them into the output file. Indexing and iteration decode
+    items on demand, so the data can still be inspected like a list.
+    """
+    
+    def __init__(self, items: Iterable[Any] = (), pretty: bool = True):
+        """
+        Args:
+            items: Initial items
+            pretty: Output mode items are encoded for; writing the list in the
+                other mode re-encodes each item as it is written
+        """
+        self.pretty = pretty
+        self._encoded: List[bytes] = []
+        for item in items:
+            self.append(item)
+    
+    def append(self, item: Any) -> None:
+        """Encode an item and add it to the list."""
+        self._encoded.append(encode_json(item, pretty=self.pretty))
+    
+    def __len__(self) -> int:
+        return len(self._encoded)
+    
+    def __iter__(self):
+        return (decode_json(item) for item in self._encoded)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [decode_json(item) for item in self._encoded[index]]
+        return decode_json(self._encoded[index])
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IncrementalJSONList):
+            if self.pretty == other.pretty:
+                return self._encoded == other._encoded
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"IncrementalJSONList({len(self)} items)"
+    
+    def write_to(self, fp: BinaryIO, indent: bytes = b'', pretty: bool = True) -> None:
+        """
+        Write the list to a binary file as a JSON array.
+        
+        Args:
+            fp: Binary file object
+            indent: Indentation of the line the array starts on (pretty output only)
+            pretty: Whether to pretty-print with 2-space indentation
+        """
+        if not self._encoded:
+            fp.write(b'[]')
+            return
+        
+        items = self._encoded
+        if pretty != self.pretty:
+            items = (encode_json(decode_json(item), pretty=pretty) for item in items)
+        
+        if not pretty:
+            fp.write(b'[')
+            for i, item in enumerate(items):
+                if i:
+                    fp.write(b',')
+                fp.write(item)
+            fp.write(b']')
+            return
+        
+        item_indent = indent + b'  '
+        fp.write(b'[')
+        for i, item in enumerate(items):
+            fp.write(b',\n' if i else b'\n')
+            fp.write(item_indent + item.replace(b'\n', b'\n' + item_indent))
+        fp.write(b'\n' + indent + b']')
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO8601 string with a 'Z' suffix, to the second."""
+    return datetime.utcnow().isoformat(timespec='seconds') + "Z"
+
+
 class BaseConverter:
     """Base class for all file format converters."""
     
+    # How FileProcessor schedules this converter in 'auto' mode: 'io' (thread pool;
+    # the default, as parsing happens in GIL-releasing C code or I/O), 'cpu'
+    # (process pool, for pure-Python parsing) or 'serial' (inline)
+    PARALLELISM = 'io'
+    
     def __init__(self, include_base64: bool = False, base64_limit: int = 1024 * 1024):
         """
         Initialize converter.
@@ -26,29 +179,38 @@ class BaseConverter:
         """
         self.include_base64 = include_base64
         self.base64_limit = base64_limit
+        # Batch timestamp set by FileProcessor; None means stamp each conversion
+        self.converted_at: Optional[str] = None
+        # Digests put in the metadata (see utils.HASH_ALGORITHMS)
+        self.hash_algorithms = DEFAULT_HASH_ALGORITHMS
     
-    def convert(self, file_path: Path, **kwargs) -> Dict[str, Any]:
+    def convert(self, file_path: Path, stat_result: Optional[os.stat_result] = None,
+                **kwargs) -> Dict[str, Any]:
         """
         Convert a file to JSON-serializable structure.
         
         Args:
             file_path: Path to the input file
+            stat_result: Already known stat of the file, reused instead of stat() calls
             **kwargs: Additional format-specific parameters
             
         Returns:
             Dictionary following the standard output schema
         """
         file_path = Path(file_path)
-        detected_type, mimetype = self._detect_type(file_path)
+        detected_type, mimetype = self._detect_type(file_path, stat_result)
         
         try:
-            metadata = extract_metadata(file_path, include_hashes=True)
+            metadata = extract_metadata(file_path, include_hashes=True, stat_result=stat_result,
+                                        hash_algorithms=self.hash_algorithms)
             # Convert mtime to ISO8601
             if metadata.get("mtime"):
                 metadata["mtime_iso"] = datetime.fromtimestamp(
                     metadata["mtime"]
-                ).isoformat()
+                ).isoformat(timespec='seconds')
             
+            # Pass the detected type along so converters don't probe the file again
+            kwargs.setdefault('detected_type', detected_type)
             data = self._extract_data(file_path, **kwargs)
             
             return {
@@ -56,7 +218,7 @@ class BaseConverter:
                 "source_path": str(file_path.absolute()),
                 "detected_type": detected_type,
                 "mimetype": mimetype,
-                "converted_at": datetime.utcnow().isoformat() + "Z",
+                "converted_at": self.converted_at or utc_timestamp(),
                 "metadata": metadata,
                 "data": data,
             }
@@ -64,28 +226,111 @@ class BaseConverter:
             logger.error(f"Error converting {file_path}: {e}", exc_info=True)
             raise
     
-    def _detect_type(self, file_path: Path) -> tuple:
+    def convert_bytes(
+        self,
+        data: bytes,
+        filename: str,
+        detected: Optional[Tuple[str, str]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Convert in-memory content (e.g. an archive member) without touching disk.
+        
+        Args:
+            data: File content
+            filename: Original file name (used for type detection and the envelope)
+            detected: Already detected (type, mimetype), to skip detection
+            **kwargs: Additional format-specific parameters
+            
+        Returns:
+            Dictionary following the standard output schema
+        """
+        detected_type, mimetype = detected or detect_file_type_bytes(data, filename)
+        
+        try:
+            metadata = {"size": len(data), "mtime": None, "mtime_iso": None}
+            metadata.update(calculate_hashes_bytes(data, self.hash_algorithms))
+            
+            kwargs.setdefault('detected_type', detected_type)
+            extracted = self._extract_data_from_bytes(data, filename, **kwargs)
+            
+            return {
+                "source_filename": Path(filename).name,
+                "source_path": filename,
+                "detected_type": detected_type,
+                "mimetype": mimetype,
+                "converted_at": self.converted_at or utc_timestamp(),
+                "metadata": metadata,
+                "data": extracted,
+            }
+        except Exception as e:
+            logger.error(f"Error converting {filename}: {e}", exc_info=True)
+            raise
+    
+    def _detect_type(self, file_path: Path, stat_result: Optional[os.stat_result] = None) -> tuple:
         """Detect file type - implemented by base class using utils."""
         from .utils import detect_file_type
-        return detect_file_type(file_path)
+        return detect_file_type(file_path, stat_result)
     
     def _extract_data(self, file_path: Path, **kwargs) -> Any:
         """
         Extract data from file - must be implemented by subclasses.
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file; convert() always passes a Path, so
+                implementations must not re-wrap it
+            **kwargs: Format-specific parameters; 'detected_type' is always
+                supplied by convert()
+                
+        Returns:
+            JSON-serializable data structure
+        """
+        raise NotImplementedError("Subclasses must implement _extract_data")
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Any:
+        """
+        Extract data from in-memory content.
+        
+        Converters whose parser accepts a buffer or file object override this.
+        The default spills the content to a temporary file for parsers that
+        need a real path.
+        
+        Args:
+            data: File content
+            filename: Original file name
             **kwargs: Format-specific parameters
             
         Returns:
             JSON-serializable data structure
         """
-        raise NotImplementedError("Subclasses must implement _extract_data")
+        fd, tmp_name = tempfile.mkstemp(suffix=Path(filename).suffix)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            return self._extract_data(Path(tmp_name), **kwargs)
+        finally:
+            os.unlink(tmp_name)
+    
+    def to_json_bytes(self, data: Dict[str, Any], pretty: bool = True) -> bytes:
+        """
+        Serialize converted data to UTF-8 encoded JSON.
+        
+        Args:
+            data: Dictionary to serialize
+            pretty: Whether to pretty-print JSON
+            
+        Returns:
+            JSON document as bytes
+        """
+        return encode_json(data, pretty=pretty)
     
     def save_json(self, output_path: Path, data: Dict[str, Any], pretty: bool = True) -> None:
         """
         Save converted data to JSON file.
         
+        IncrementalJSONList values are streamed into the file item by item
+        rather than being rendered into one document in memory.
+        
         Args:
             output_path: Path to output JSON file
             data: Dictionary to save
@@ -94,11 +339,27 @@ class BaseConverter:
         from .utils import ensure_output_dir
         ensure_output_dir(output_path)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(data, f, ensure_ascii=False)
+        # Encode the envelope with a unique placeholder string in place of each
+        # incremental list, then write the lists where their placeholders landed
+        token = uuid.uuid4().hex
+        streamed: List[IncrementalJSONList] = []
+        
+        def placeholder(obj: Any) -> Any:
+            if isinstance(obj, IncrementalJSONList):
+                streamed.append(obj)
+                return f"{token}:{len(streamed) - 1}"
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        
+        payload = encode_json(data, pretty=pretty, default=placeholder)
+        parts = re.split(b'"' + token.encode('ascii') + rb':(\d+)"', payload)
+        
+        with open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(parts[0])
+            for i in range(1, len(parts), 2):
+                preceding = parts[i - 1]
+                line = preceding[preceding.rfind(b'\n') + 1:]
+                indent = line[:len(line) - len(line.lstrip(b' '))]
+                streamed[int(parts[i])].write_to(f, indent=indent, pretty=pretty)
+                f.write(parts[i + 1])
         
         logger.debug(f"Saved JSON to {output_path}")
-
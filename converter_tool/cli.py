@@ -92,6 +92,15 @@ Examples:
         help='Number of worker threads for parallel processing (default: CPU count)'
     )
     
+    parser.add_argument(
+        '--parallelism',
+        choices=['auto', 'thread', 'process', 'serial'],
+        default='auto',
+        help='Execution mode: auto routes CPU-bound converters (PDF, PCAP, XML, text) to '
+             'processes and the rest to threads; thread, process or serial '
+             'force one mode (default: auto)'
+    )
+    
     parser.add_argument(
         '--max-packets',
         type=int,
@@ -105,6 +114,30 @@ Examples:
         help='Include base64-encoded content for binary files (up to 1MB)'
     )
     
+    parser.add_argument(
+        '--csv-columnar',
+        action='store_true',
+        help='Emit CSV data as {column: [values]} instead of one object per row'
+    )
+    
+    parser.add_argument(
+        '--pcap-columnar',
+        action='store_true',
+        help='Emit PCAP packets as {field: [values]} instead of one object per packet'
+    )
+    
+    parser.add_argument(
+        '--legacy-hashes',
+        action='store_true',
+        help='Also compute SHA1 and MD5 digests (only SHA256 by default)'
+    )
+    
+    parser.add_argument(
+        '--include-evtx-xml',
+        action='store_true',
+        help='Include the full XML of each EVTX record in the output'
+    )
+    
     return parser.parse_args()
 
 
@@ -136,6 +169,11 @@ def main() -> int:
         workers=args.workers,
         max_packets=args.max_packets,
         include_base64=args.include_base64,
+        include_evtx_xml=args.include_evtx_xml,
+        parallelism=args.parallelism,
+        csv_columnar=args.csv_columnar,
+        pcap_columnar=args.pcap_columnar,
+        legacy_hashes=args.legacy_hashes,
     )
     
     # Process input
@@ -1,28 +1,35 @@
 """
 Format-specific converters module.
+
+Converter classes are imported on first access, so importing one converter
+doesn't load the others (and their optional backends).
 """
 
-from .evtx import EvtxConverter
-from .pcap import PcapConverter
-from .csv_converter import CsvConverter
-from .json_converter import JsonConverter
-from .xml_converter import XmlConverter
-from .text_converter import TextConverter
-from .pdf_converter import PdfConverter
-from .docx_converter import DocxConverter
-from .archive_converter import ArchiveConverter
-from .binary_converter import BinaryConverter
-
-__all__ = [
-    "EvtxConverter",
-    "PcapConverter",
-    "CsvConverter",
-    "JsonConverter",
-    "XmlConverter",
-    "TextConverter",
-    "PdfConverter",
-    "DocxConverter",
-    "ArchiveConverter",
-    "BinaryConverter",
-]
+import importlib
+
+_MODULES = {
+    "EvtxConverter": ".evtx",
+    "PcapConverter": ".pcap",
+    "CsvConverter": ".csv_converter",
+    "JsonConverter": ".json_converter",
+    "XmlConverter": ".xml_converter",
+    "TextConverter": ".text_converter",
+    "PdfConverter": ".pdf_converter",
+    "DocxConverter": ".docx_converter",
+    "ArchiveConverter": ".archive_converter",
+    "BinaryConverter": ".binary_converter",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    converter_class = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = converter_class
+    return converter_class
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
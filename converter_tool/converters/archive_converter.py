@@ -2,21 +2,63 @@
 Converter for archive files (.zip, .tar, .tar.gz).
 """
 
+import functools
+import inspect
+import io
 import logging
+import os
+import shutil
 import tarfile
+import tempfile
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import Executor, Future
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Deque, Dict, Optional, Tuple, Type, Union
 
-from ..base_converter import BaseConverter
+from ..base_converter import BaseConverter, IncrementalJSONList
+from ..utils import detect_file_type_bytes
 
 logger = logging.getLogger(__name__)
 
+# Members with these suffixes would only ever reach BinaryConverter, so they are
+# listed without being read
+_NON_CONVERTIBLE_SUFFIXES = {
+    '.exe', '.dll', '.so', '.bin', '.o', '.obj',
+    '.png', '.jpg', '.jpeg', '.gif', '.mp4',
+}
+
+
+# Members larger than this are copied to a temporary file in chunks of the same
+# size, instead of being decompressed into memory in one piece
+MEMBER_SPOOL_SIZE = 1024 * 1024
+
+# Header bytes read from a spilled member for type detection
+_DETECTION_HEADER_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=None)
+def _member_converter(detected_type: str) -> Tuple[Optional[Type[BaseConverter]], bool]:
+    """
+    Look up the converter class for a member type and whether that class takes
+    a recursion depth, once per type and process.
+    
+    Returns:
+        (converter class, takes recursion_depth), or (None, False) for
+        types without a registered converter
+    """
+    from ..registry import CONVERTER_REGISTRY, get_converter
+    if detected_type not in CONVERTER_REGISTRY:
+        return None, False
+    cls = get_converter(detected_type)
+    return cls, 'recursion_depth' in inspect.signature(cls.__init__).parameters
+
 
 class ArchiveConverter(BaseConverter):
     """Converter for archive files."""
     
-    def __init__(self, include_base64: bool = False, base64_limit: int = 1024 * 1024, 
+    def __init__(self, include_base64: bool = False, base64_limit: int = 1024 * 1024,
                  recursion_depth: int = 3):
         """
         Initialize archive converter.
@@ -28,6 +70,10 @@ class ArchiveConverter(BaseConverter):
         """
         super().__init__(include_base64, base64_limit)
         self.recursion_depth = recursion_depth
+        # Optional pool for converting members off the reading thread (set by
+        # FileProcessor); max_pending bounds how many read members wait in it
+        self.executor: Optional[Executor] = None
+        self.max_pending = 8
     
     def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """
@@ -36,27 +82,174 @@ class ArchiveConverter(BaseConverter):
         Returns:
             Dictionary with file listing and converted contents
         """
-        file_path = Path(file_path)
-        detected_type, _ = self._detect_type(file_path)
+        detected_type = kwargs.get('detected_type') or self._detect_type(file_path)[0]
+        
+        if detected_type == 'zip':
+            return self._extract_zip(file_path, file_path)
+        elif detected_type in ('tar', 'gzip'):
+            return self._extract_tar(file_path, file_path)
+        else:
+            raise ValueError(f"Unsupported archive type: {detected_type}")
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """Extract contents from an in-memory (nested) archive."""
+        detected_type = kwargs.get('detected_type') or detect_file_type_bytes(data, filename)[0]
         
         if detected_type == 'zip':
-            return self._extract_zip(file_path)
+            return self._extract_zip(io.BytesIO(data), filename)
         elif detected_type in ('tar', 'gzip'):
-            return self._extract_tar(file_path)
+            return self._extract_tar(io.BytesIO(data), filename)
         else:
             raise ValueError(f"Unsupported archive type: {detected_type}")
     
-    def _extract_zip(self, file_path: Path) -> Dict[str, Any]:
-        """Extract ZIP archive."""
-        files = []
+    def _should_convert(self, member_name: str, size: int) -> bool:
+        """
+        Decide from the member header alone whether it is worth reading.
+        
+        Args:
+            member_name: Member name inside the archive
+            size: Uncompressed member size
+            
+        Returns:
+            False for known binary suffixes and members larger than 16x base64_limit
+        """
+        if os.path.splitext(member_name)[1].lower() in _NON_CONVERTIBLE_SUFFIXES:
+            return False
+        return size <= self.base64_limit * 16
+    
+    def _read_member(self, src: BinaryIO, size: int, member_name: str) -> Union[bytes, Path]:
+        """
+        Read a member's content, spilling large members to a temporary file.
+        
+        Args:
+            src: Member file object
+            size: Uncompressed member size
+            member_name: Member name inside the archive
+            
+        Returns:
+            The content, or the path of a temporary file holding it if it is
+            larger than MEMBER_SPOOL_SIZE (removed by _convert_member)
+        """
+        if size <= MEMBER_SPOOL_SIZE:
+            return src.read()
+        
+        fd, tmp_name = tempfile.mkstemp(suffix=os.path.splitext(member_name)[1])
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                shutil.copyfileobj(src, dst, MEMBER_SPOOL_SIZE)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return Path(tmp_name)
+    
+    def _convert_member(self, content: Union[bytes, Path], member_name: str) -> Optional[Any]:
+        """
+        Convert an archive member.
+        
+        Only the converted data is used, so the per-member envelope (hashes,
+        timestamps) is never built.
+        
+        Args:
+            content: Member content, or a temporary file from _read_member
+                (deleted once converted)
+            member_name: Member name inside the archive
+            
+        Returns:
+            Converted data, or None if the member is binary or could not be converted
+        """
+        try:
+            if isinstance(content, Path):
+                with open(content, 'rb') as f:
+                    header = f.read(_DETECTION_HEADER_SIZE)
+                detected_type, _ = detect_file_type_bytes(header, member_name)
+            else:
+                detected_type, _ = detect_file_type_bytes(content, member_name)
+            if detected_type == 'binary':
+                return None
+            
+            converter, has_recursion_depth = _member_converter(detected_type)
+            if converter is None:
+                return None
+            
+            converter_instance = converter(
+                include_base64=self.include_base64,
+                base64_limit=self.base64_limit
+            )
+            converter_instance.converted_at = self.converted_at
+            converter_instance.hash_algorithms = self.hash_algorithms
+            if has_recursion_depth:
+                converter_instance.recursion_depth = self.recursion_depth - 1
+            
+            if isinstance(content, Path):
+                return converter_instance._extract_data(content, detected_type=detected_type)
+            return converter_instance._extract_data_from_bytes(
+                content, member_name, detected_type=detected_type
+            )
+        except Exception as e:
+            logger.debug(f"Could not convert {member_name}: {e}")
+            return None
+        finally:
+            if isinstance(content, Path):
+                content.unlink()
+    
+    def _submit_member(self, content: Union[bytes, Path], member_name: str,
+                       slots: threading.BoundedSemaphore) -> Future:
+        """Queue a member for conversion on the executor, blocking while max_pending are queued."""
+        slots.acquire()
+        try:
+            future = self.executor.submit(self._convert_member, content, member_name)
+        except Exception:
+            slots.release()
+            if isinstance(content, Path):
+                content.unlink()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+    
+    def _flush_pending(self, pending: Deque[Tuple[Dict[str, Any], Optional[Future]]],
+                       files: IncrementalJSONList, wait: bool = False) -> None:
+        """
+        Move finished file entries, in archive order, into the file listing.
+        
+        Args:
+            pending: Entries with their queued conversion (None if already complete)
+            files: Listing the entries are appended to (and encoded by)
+            wait: Wait for all queued conversions instead of stopping at the first unfinished one
+        """
+        while pending:
+            file_obj, future = pending[0]
+            if future is not None:
+                if not wait and not future.done():
+                    return
+                try:
+                    converted = future.result()
+                    if converted is not None:
+                        file_obj["converted_content"] = converted
+                except Exception as e:
+                    logger.warning(f"Error processing archive file {file_obj['filename']}: {e}")
+            
+            files.append(file_obj)
+            pending.popleft()
+    
+    def _extract_zip(self, source, name) -> Dict[str, Any]:
+        """
+        Extract ZIP archive.
+        
+        Args:
+            source: Archive path or binary file object
+            name: Archive name used in log messages
+        """
+        files = IncrementalJSONList()
+        pending = deque()
+        slots = threading.BoundedSemaphore(self.max_pending)
         
         try:
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                for file_name in file_list:
-                    file_info = zip_ref.getinfo(file_name)
+            with zipfile.ZipFile(source, 'r') as zip_ref:
+                # infolist() is already built from the central directory, no per-name lookup
+                for file_info in zip_ref.infolist():
+                    file_name = file_info.filename
                     
+                    future = None
                     file_obj = {
                         "filename": file_name,
                         "size": file_info.file_size,
@@ -65,45 +258,30 @@ class ArchiveConverter(BaseConverter):
                     }
                     
                     # Try to convert supported files recursively
-                    if not file_obj["is_directory"] and self.recursion_depth > 0:
+                    if (not file_obj["is_directory"] and self.recursion_depth > 0
+                            and self._should_convert(file_name, file_info.file_size)):
                         try:
-                            # Read file content
-                            content = zip_ref.read(file_name)
-                            
-                            # Save to temp location and convert
-                            import tempfile
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file_name).suffix) as tmp:
-                                tmp.write(content)
-                                tmp_path = Path(tmp.name)
-                            
-                            try:
-                                # Try to convert the extracted file
-                                detected_type, _ = self._detect_type(tmp_path)
-                                if detected_type != 'binary' and self.recursion_depth > 0:
-                                    from ..registry import get_converter
-                                    converter = get_converter(detected_type)
-                                    converter_instance = converter(
-                                        include_base64=self.include_base64,
-                                        base64_limit=self.base64_limit
-                                    )
-                                    if hasattr(converter_instance, 'recursion_depth'):
-                                        converter_instance.recursion_depth = self.recursion_depth - 1
-                                    
-                                    converted = converter_instance.convert(tmp_path)
-                                    file_obj["converted_content"] = converted["data"]
-                            except Exception as e:
-                                logger.debug(f"Could not convert {file_name}: {e}")
-                            finally:
-                                tmp_path.unlink()
-                        
+                            with zip_ref.open(file_info) as src:
+                                content = self._read_member(src, file_info.file_size, file_name)
+                            if self.executor is not None:
+                                future = self._submit_member(content, file_name, slots)
+                            else:
+                                converted = self._convert_member(content, file_name)
+                                if converted is not None:
+                                    file_obj["converted_content"] = converted
                         except Exception as e:
                             logger.warning(f"Error processing archive file {file_name}: {e}")
                     
-                    files.append(file_obj)
+                    # Entries are encoded into the listing once their conversion is done
+                    pending.append((file_obj, future))
+                    self._flush_pending(pending, files)
         
         except Exception as e:
-            logger.error(f"Error reading ZIP file {file_path}: {e}")
+            logger.error(f"Error reading ZIP file {name}: {e}")
             raise
+        finally:
+            # The archive is already closed; only finished reads are waited on
+            self._flush_pending(pending, files, wait=True)
         
         return {
             "archive_type": "zip",
@@ -111,17 +289,30 @@ class ArchiveConverter(BaseConverter):
             "files": files,
         }
     
-    def _extract_tar(self, file_path: Path) -> Dict[str, Any]:
-        """Extract TAR/TAR.GZ archive."""
-        files = []
+    def _extract_tar(self, source, name) -> Dict[str, Any]:
+        """
+        Extract TAR/TAR.GZ archive.
+        
+        Args:
+            source: Archive path or binary file object
+            name: Archive name used in log messages
+        """
+        files = IncrementalJSONList()
+        pending = deque()
+        slots = threading.BoundedSemaphore(self.max_pending)
         
         try:
-            mode = 'r:gz' if file_path.suffix == '.gz' or '.tar.gz' in str(file_path) else 'r'
+            # Stream mode ('r|*') reads members sequentially in a single pass instead of
+            # scanning the whole (possibly compressed) archive up front; compression
+            # is detected from the stream itself
+            if isinstance(source, Path):
+                tar_ref = tarfile.open(source, 'r|*')
+            else:
+                tar_ref = tarfile.open(fileobj=source, mode='r|*')
             
-            with tarfile.open(file_path, mode) as tar_ref:
-                members = tar_ref.getmembers()
-                
-                for member in members:
+            with tar_ref:
+                for member in tar_ref:
+                    future = None
                     file_obj = {
                         "filename": member.name,
                         "size": member.size,
@@ -131,48 +322,34 @@ class ArchiveConverter(BaseConverter):
                     }
                     
                     # Try to convert supported files recursively
-                    if not file_obj["is_directory"] and self.recursion_depth > 0:
+                    if (member.isfile() and self.recursion_depth > 0
+                            and self._should_convert(member.name, member.size)):
                         try:
-                            # Extract to temp location
-                            import tempfile
-                            with tempfile.NamedTemporaryFile(delete=False, suffix=Path(member.name).suffix) as tmp:
-                                extracted = tar_ref.extractfile(member)
-                                if extracted:
-                                    tmp.write(extracted.read())
-                                tmp_path = Path(tmp.name)
-                            
-                            try:
-                                # Try to convert the extracted file
-                                detected_type, _ = self._detect_type(tmp_path)
-                                if detected_type != 'binary' and self.recursion_depth > 0:
-                                    from ..registry import get_converter
-                                    converter = get_converter(detected_type)
-                                    converter_instance = converter(
-                                        include_base64=self.include_base64,
-                                        base64_limit=self.base64_limit
-                                    )
-                                    if hasattr(converter_instance, 'recursion_depth'):
-                                        converter_instance.recursion_depth = self.recursion_depth - 1
-                                    
-                                    converted = converter_instance.convert(tmp_path)
-                                    file_obj["converted_content"] = converted["data"]
-                            except Exception as e:
-                                logger.debug(f"Could not convert {member.name}: {e}")
-                            finally:
-                                tmp_path.unlink()
-                        
+                            extracted = tar_ref.extractfile(member)
+                            content = self._read_member(extracted, member.size, member.name)
+                            if self.executor is not None:
+                                future = self._submit_member(content, member.name, slots)
+                            else:
+                                converted = self._convert_member(content, member.name)
+                                if converted is not None:
+                                    file_obj["converted_content"] = converted
                         except Exception as e:
                             logger.warning(f"Error processing archive file {member.name}: {e}")
                     
-                    files.append(file_obj)
+                    pending.append((file_obj, future))
+                    self._flush_pending(pending, files)
+                    
+                    # Don't let TarFile accumulate every member it has seen
+                    tar_ref.members.clear()
         
         except Exception as e:
-            logger.error(f"Error reading TAR file {file_path}: {e}")
+            logger.error(f"Error reading TAR file {name}: {e}")
             raise
+        finally:
+            self._flush_pending(pending, files, wait=True)
         
         return {
             "archive_type": "tar",
             "file_count": len(files),
             "files": files,
         }
-
@@ -4,6 +4,7 @@ Converter for unknown binary files (metadata extraction only).
 
 import base64
 import logging
+import mmap
 from pathlib import Path
 from typing import Any, Dict
 
@@ -22,7 +23,6 @@ class BinaryConverter(BaseConverter):
         Returns:
             Dictionary with metadata and optional base64 preview
         """
-        file_path = Path(file_path)
         stat = file_path.stat()
         
         data = {
@@ -34,12 +34,29 @@ class BinaryConverter(BaseConverter):
         # Include base64 preview if requested and file is small enough
         if self.include_base64 and stat.st_size <= self.base64_limit:
             try:
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    data["base64_preview"] = base64.b64encode(content).decode('utf-8')
-                    data["has_preview"] = True
+                if stat.st_size == 0:
+                    data["base64_preview"] = ""
+                else:
+                    # Encode straight from the mapping, without reading a bytes copy first
+                    with open(file_path, 'rb') as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data["base64_preview"] = base64.b64encode(mm).decode('ascii')
+                data["has_preview"] = True
             except Exception as e:
                 logger.warning(f"Error reading file for base64 preview: {e}")
         
         return data
-
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """Extract metadata for in-memory binary content."""
+        result = {
+            "binary_type": "unknown",
+            "size": len(data),
+            "has_preview": False,
+        }
+        
+        if self.include_base64 and len(data) <= self.base64_limit:
+            result["base64_preview"] = base64.b64encode(data).decode('ascii')
+            result["has_preview"] = True
+        
+        return result
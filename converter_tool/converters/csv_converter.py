@@ -3,11 +3,13 @@ Converter for CSV files.
 """
 
 import csv
+import io
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
 from ..base_converter import BaseConverter
+from ..utils import IO_BUFFER_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -15,38 +17,138 @@ logger = logging.getLogger(__name__)
 class CsvConverter(BaseConverter):
     """Converter for CSV files."""
     
-    def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
+    def _extract_data(self, file_path: Path, columnar: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Extract rows from CSV file.
         
+        Args:
+            columnar: Emit a {column: [values]} mapping instead of per-row dicts
+            
         Returns:
-            Dictionary with 'rows' array and 'column_names'
+            Dictionary with 'rows' array (or 'columns' mapping) and 'column_names'
         """
-        rows = []
-        column_names = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                # Try to detect delimiter
-                sample = f.read(1024)
-                f.seek(0)
-                
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
-                
-                reader = csv.DictReader(f, delimiter=delimiter)
-                column_names = reader.fieldnames or []
-                
-                for row in reader:
-                    rows.append(dict(row))
-        
+            with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as fb:
+                return self._parse(fb, str(file_path), columnar)
         except Exception as e:
             logger.error(f"Error reading CSV file {file_path}: {e}")
             raise
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, columnar: bool = False,
+                                 **kwargs) -> Dict[str, Any]:
+        """Extract rows from in-memory CSV content."""
+        try:
+            return self._parse(io.BytesIO(data), data, columnar)
+        except Exception as e:
+            logger.error(f"Error reading CSV content {filename}: {e}")
+            raise
+    
+    def _parse(self, fb, source, columnar: bool = False) -> Dict[str, Any]:
+        """
+        Parse CSV content, using pyarrow's bulk reader when available.
+        
+        Args:
+            fb: Seekable binary file object over the content
+            source: Path string or bytes handed to pyarrow
+            columnar: Emit a {column: [values]} mapping instead of per-row dicts
+            
+        Returns:
+            Dictionary with 'rows' array (or 'columns' mapping) and 'column_names'
+        """
+        # Try to detect delimiter; only the sample is decoded for the sniffer
+        sample = fb.read(1024).decode('utf-8', errors='replace')
+        fb.seek(0)
+        
+        sniffer = csv.Sniffer()
+        delimiter = sniffer.sniff(sample).delimiter
+        
+        with io.TextIOWrapper(fb, encoding='utf-8', errors='replace', newline='') as f:
+            return self._parse_text(f, source, delimiter, columnar)
+    
+    def _parse_text(self, f, source, delimiter: str, columnar: bool) -> Dict[str, Any]:
+        """Read the decoded content in a single pass (see _parse)."""
+        header = next(csv.reader(f, delimiter=delimiter), [])
+        f.seek(0)
+        
+        table = self._read_with_pyarrow(source, delimiter, header)
+        if table is not None:
+            column_names = header
+            row_count = table.num_rows
+            if columnar:
+                columns = table.to_pydict()
+            else:
+                rows = table.to_pylist()
+        else:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            column_names = reader.fieldnames or []
+            
+            rows = []
+            for row in reader:
+                rows.append(dict(row))
+            
+            row_count = len(rows)
+            if columnar:
+                columns = {name: [row.get(name) for row in rows] for name in column_names}
         
-        return {
+        result = {
             "column_names": column_names,
-            "row_count": len(rows),
-            "rows": rows,
+            "row_count": row_count,
         }
-
+        if columnar:
+            result["columns"] = columns
+        else:
+            result["rows"] = rows
+        
+        return result
+    
+    def _read_with_pyarrow(self, source, delimiter: str, header: List[str]):
+        """
+        Read CSV into a pyarrow Table with every column kept as a string.
+        
+        Args:
+            source: Path string or bytes
+            delimiter: Field delimiter
+            header: Column names from the first row
+            
+        Returns:
+            pyarrow Table, or None if pyarrow is missing or can't parse the content
+            (the csv module is then used instead)
+        """
+        # pyarrow drops a leading UTF-8 BOM that the csv module keeps in the
+        # first name; type the columns by pyarrow's names, then restore ours
+        arrow_names = list(header)
+        if arrow_names and arrow_names[0].startswith('\ufeff'):
+            arrow_names[0] = arrow_names[0][1:]
+        
+        # Duplicate names would be merged differently than csv.DictReader does
+        if not header or len(set(arrow_names)) != len(arrow_names):
+            return None
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+        except ImportError:
+            return None
+        
+        try:
+            if isinstance(source, bytes):
+                source = pa.BufferReader(source)
+            
+            table = pacsv.read_csv(
+                source,
+                parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in arrow_names},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+        except Exception as e:
+            logger.debug(f"pyarrow could not read CSV ({e}), falling back to csv module")
+            return None
+        
+        # Any other disagreement on the header would leave columns untyped
+        if table.column_names != arrow_names:
+            logger.debug("pyarrow read a different CSV header, falling back to csv module")
+            return None
+        return table.rename_columns(header)
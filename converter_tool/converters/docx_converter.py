@@ -2,14 +2,53 @@
 Converter for Microsoft Word (.docx) files.
 """
 
+import io
 import logging
+import posixpath
+import zipfile
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from ..base_converter import BaseConverter
 
 logger = logging.getLogger(__name__)
 
+W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+_W = '{' + W_NS['w'] + '}'
+
+# OPC relationships leading from the package to the document and its styles
+_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_RT_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_RT_STYLES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+
+# Built-in styles stored lowercase in styles.xml but reported capitalized by python-docx
+_UI_STYLE_NAMES = {
+    name.lower(): name
+    for name in ('Caption', 'Footer', 'Header', *(f'Heading {i}' for i in range(1, 10)))
+}
+
+# Text of run content elements other than w:t and w:br, as python-docx renders them
+_RUN_CONTENT_TEXT = {
+    f'{_W}tab': '\t',
+    f'{_W}ptab': '\t',
+    f'{_W}cr': '\n',
+    f'{_W}noBreakHyphen': '-',
+}
+
+# Pre-compiled XPath expressions (lxml is optional, python-docx is the fallback)
+try:
+    from lxml import etree as lxml_etree
+    
+    # Body-level paragraphs only, matching python-docx's Document.paragraphs
+    _XP_PARAGRAPHS = lxml_etree.XPath('/w:document/w:body/w:p', namespaces=W_NS)
+    # Run content python-docx reads for Paragraph.text: direct runs and hyperlink
+    # runs only, so tracked insertions, fields and text boxes are left out
+    _XP_RUN_CONTENT = lxml_etree.XPath('w:r/* | w:hyperlink/w:r/*', namespaces=W_NS)
+    _XP_PARA_STYLE = lxml_etree.XPath('string(w:pPr/w:pStyle/@w:val)', namespaces=W_NS)
+    _XP_STYLES = lxml_etree.XPath("/w:styles/w:style[@w:type='paragraph']", namespaces=W_NS)
+except ImportError:
+    lxml_etree = None
+
 
 class DocxConverter(BaseConverter):
     """Converter for DOCX files."""
@@ -21,6 +60,38 @@ class DocxConverter(BaseConverter):
         Returns:
             Dictionary with paragraphs array
         """
+        return self._extract_paragraphs(str(file_path), file_path)
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """Extract paragraphs from in-memory DOCX content."""
+        return self._extract_paragraphs(io.BytesIO(data), filename)
+    
+    def _extract_paragraphs(self, source, name) -> Dict[str, Any]:
+        """
+        Extract paragraphs from a DOCX path or file object.
+        
+        With lxml available, the main document part is read directly and walked
+        with compiled XPath; python-docx's object model is the fallback.
+        
+        Args:
+            source: Path string or binary file object accepted by python-docx
+            name: Name used in log messages
+            
+        Returns:
+            Dictionary with paragraphs array
+        """
+        if lxml_etree is not None:
+            try:
+                paragraphs = self._paragraphs_lxml(source)
+            except Exception as e:
+                logger.error(f"Error reading DOCX file {name}: {e}")
+                raise
+            
+            return {
+                "paragraph_count": len(paragraphs),
+                "paragraphs": paragraphs,
+            }
+        
         try:
             from docx import Document
         except ImportError:
@@ -32,7 +103,7 @@ class DocxConverter(BaseConverter):
         paragraphs = []
         
         try:
-            doc = Document(str(file_path))
+            doc = Document(source)
             
             for para_num, paragraph in enumerate(doc.paragraphs, start=1):
                 text = paragraph.text.strip()
@@ -45,11 +116,94 @@ class DocxConverter(BaseConverter):
                     paragraphs.append(para_obj)
         
         except Exception as e:
-            logger.error(f"Error reading DOCX file {file_path}: {e}")
+            logger.error(f"Error reading DOCX file {name}: {e}")
             raise
         
         return {
             "paragraph_count": len(paragraphs),
             "paragraphs": paragraphs,
         }
+    
+    @staticmethod
+    def _paragraphs_lxml(source) -> List[Dict[str, Any]]:
+        """Extract non-empty body paragraphs straight from the OOXML parts."""
+        # Untrusted input: no entity expansion or network access, as python-docx parses
+        parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+        
+        with zipfile.ZipFile(source) as z:
+            document_part = _related_part(z, parser, '', _RT_OFFICE_DOCUMENT)
+            if document_part is None:
+                raise ValueError("No main document part in package")
+            document = lxml_etree.fromstring(z.read(document_part), parser)
+            
+            styles_part = _related_part(z, parser, document_part, _RT_STYLES)
+            try:
+                styles = lxml_etree.fromstring(z.read(styles_part), parser) if styles_part else None
+            except KeyError:
+                styles = None
+        
+        # Map style IDs (w:pStyle/@w:val) to display names, as python-docx reports them
+        style_names = {}
+        default_style: Optional[str] = None
+        if styles is not None:
+            for style in _XP_STYLES(styles):
+                name_elem = style.find(f'{_W}name')
+                style_name = name_elem.get(f'{_W}val') if name_elem is not None else None
+                if style_name is None:
+                    continue
+                style_name = _UI_STYLE_NAMES.get(style_name, style_name)
+                style_names[style.get(f'{_W}styleId')] = style_name
+                if style.get(f'{_W}default') in ('1', 'true', 'on'):
+                    default_style = style_name
+        
+        paragraphs = []
+        for para_num, p in enumerate(_XP_PARAGRAPHS(document), start=1):
+            parts = []
+            for node in _XP_RUN_CONTENT(p):
+                tag = node.tag
+                if tag == f'{_W}t':
+                    parts.append(node.text or '')
+                elif tag == f'{_W}br':
+                    # Page and column breaks have no text equivalent
+                    if node.get(f'{_W}type', 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                else:
+                    parts.append(_RUN_CONTENT_TEXT.get(tag, ''))
+            
+            text = ''.join(parts).strip()
+            if text:  # Only include non-empty paragraphs
+                style_id = _XP_PARA_STYLE(p)
+                paragraphs.append({
+                    "paragraph_number": para_num,
+                    "text": text,
+                    "style": style_names.get(style_id, default_style) if style_id else default_style,
+                })
+        
+        return paragraphs
+
 
+def _related_part(z: zipfile.ZipFile, parser, source_part: str, rel_type: str) -> Optional[str]:
+    """
+    Resolve a part's first internal relationship of the given type.
+    
+    Args:
+        z: Open DOCX package
+        parser: lxml parser for the relationships part
+        source_part: Zip member name of the source part ('' for the package itself)
+        rel_type: Relationship type URI
+        
+    Returns:
+        Zip member name of the target part, or None if there is no such relationship
+    """
+    directory, name = posixpath.split(source_part)
+    try:
+        rels = lxml_etree.fromstring(z.read(posixpath.join(directory, '_rels', name + '.rels')), parser)
+    except KeyError:
+        return None
+    
+    for rel in rels.iterfind(_RELATIONSHIP):
+        if rel.get('Type') == rel_type and rel.get('TargetMode') != 'External':
+            # Targets are relative to the source part's directory unless absolute
+            target = posixpath.join('/', directory, rel.get('Target', ''))
+            return posixpath.normpath(target).lstrip('/')
+    return None
@@ -2,86 +2,57 @@
 Converter for Windows Event Log (.evtx) files.
 """
 
+import io
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
-from ..base_converter import BaseConverter
+from ..base_converter import BaseConverter, IncrementalJSONList
 
 logger = logging.getLogger(__name__)
 
+EVTX_NS = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+
+# Namespace-qualified tags, built once
+_NS = '{' + EVTX_NS['e'] + '}'
+_TAG_EVENT_ID = _NS + 'EventID'
+_TAG_TIME_CREATED = _NS + 'TimeCreated'
+_TAG_RECORD_ID = _NS + 'EventRecordID'
+_TAG_DATA = _NS + 'Data'
+_INTERESTING_TAGS = (_TAG_EVENT_ID, _TAG_TIME_CREATED, _TAG_RECORD_ID, _TAG_DATA)
+
+# lxml is optional, ElementTree is the fallback
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 
 class EvtxConverter(BaseConverter):
     """Converter for Windows EVTX files."""
     
-    def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
+    def _extract_data(self, file_path: Path, include_xml: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Extract records from EVTX file.
         
+        Args:
+            include_xml: Include the full record XML in each record (default: False)
+            
         Returns:
             Dictionary with 'records' array containing event records
         """
+        # Availability probe; _iter_records imports the modules it uses
         try:
-            import Evtx.Evtx as evtx
-            import Evtx.Views as evtx_views
+            import Evtx  # noqa: F401
         except ImportError:
             raise ImportError(
                 "python-evtx is required for .evtx files. "
                 "Install with: pip install python-evtx"
             )
         
-        records = []
-        
         try:
-            with open(str(file_path), 'rb') as f:
-                evtx_file = evtx.Evtx(f)
-                for record in evtx_file.records():
-                    try:
-                        event = evtx_views.evtx_record_xml_view(record)
-                        
-                        # Parse XML to extract key fields
-                        import xml.etree.ElementTree as ET
-                        root = ET.fromstring(event)
-                        
-                        # Extract EventID
-                        event_id = None
-                        event_id_elem = root.find('.//{http://schemas.microsoft.com/win/2004/08/events/event}EventID')
-                        if event_id_elem is not None:
-                            event_id = event_id_elem.text
-                        
-                        # Extract TimeCreated
-                        time_created = None
-                        time_elem = root.find('.//{http://schemas.microsoft.com/win/2004/08/events/event}TimeCreated')
-                        if time_elem is not None:
-                            time_created = time_elem.get('SystemTime')
-                        
-                        # Extract EventRecordID
-                        event_record_id = None
-                        record_id_elem = root.find('.//{http://schemas.microsoft.com/win/2004/08/events/event}EventRecordID')
-                        if record_id_elem is not None:
-                            event_record_id = record_id_elem.text
-                        
-                        # Extract all Data elements
-                        data_dict = {}
-                        for data_elem in root.findall('.//{http://schemas.microsoft.com/win/2004/08/events/event}Data'):
-                            name = data_elem.get('Name')
-                            value = data_elem.text
-                            if name:
-                                data_dict[name] = value
-                        
-                        record_obj = {
-                            "EventID": event_id,
-                            "TimeCreated": time_created,
-                            "EventRecordID": event_record_id,
-                            "data": data_dict,
-                            "xml": event,  # Include full XML for reference
-                        }
-                        records.append(record_obj)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error parsing EVTX record: {e}")
-                        continue
-                        
+            # Each record is encoded as it is parsed; save_json streams them out
+            records = IncrementalJSONList(self._iter_records(file_path, include_xml))
         except Exception as e:
             logger.error(f"Error reading EVTX file {file_path}: {e}")
             raise
@@ -90,4 +61,117 @@ class EvtxConverter(BaseConverter):
             "record_count": len(records),
             "records": records,
         }
-
+    
+    def _iter_records(self, file_path: Path, include_xml: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse EVTX records one at a time.
+        
+        Args:
+            file_path: Path to the EVTX file
+            include_xml: Include the full record XML in each record
+            
+        Yields:
+            Record dictionaries
+        """
+        import xml.etree.ElementTree as ET
+        
+        import Evtx.Evtx as evtx
+        import Evtx.Views as evtx_views
+        
+        with open(file_path, 'rb') as f:
+            evtx_file = evtx.Evtx(f)
+            for record in evtx_file.records():
+                try:
+                    event = evtx_views.evtx_record_xml_view(record)
+                    
+                    # Parse XML to extract key fields
+                    if lxml_etree is not None:
+                        event_id, time_created, event_record_id, data_dict = self._fields_lxml(
+                            event.encode('utf-8'))
+                    else:
+                        event_id, time_created, event_record_id, data_dict = self._fields_etree(
+                            ET.fromstring(event))
+                    
+                    record_obj = {
+                        "EventID": event_id,
+                        "TimeCreated": time_created,
+                        "EventRecordID": event_record_id,
+                        "data": data_dict,
+                    }
+                    if include_xml:
+                        record_obj["xml"] = event
+                    
+                    # Release the XML string before the next record
+                    del event
+                    
+                except Exception as e:
+                    logger.warning(f"Error parsing EVTX record: {e}")
+                    continue
+                
+                yield record_obj
+    
+    @staticmethod
+    def _fields_lxml(xml: bytes) -> tuple:
+        """
+        Extract key record fields in one streaming pass with lxml.iterparse.
+        
+        Only the interesting elements generate events, and each is cleared once
+        read, so no full tree is kept for the record.
+        
+        Args:
+            xml: UTF-8 encoded record XML
+            
+        Returns:
+            Tuple of (EventID, TimeCreated, EventRecordID, data dict); Data
+            elements without a value are left out of the data dict
+        """
+        event_id = time_created = event_record_id = None
+        data_dict = {}
+        
+        for _, elem in lxml_etree.iterparse(io.BytesIO(xml), events=('end',), tag=_INTERESTING_TAGS):
+            tag = elem.tag
+            if tag == _TAG_DATA:
+                name = elem.get('Name')
+                if name and elem.text is not None:
+                    data_dict[name] = elem.text
+            elif tag == _TAG_EVENT_ID:
+                if event_id is None:
+                    event_id = elem.text
+            elif tag == _TAG_TIME_CREATED:
+                if time_created is None:
+                    time_created = elem.get('SystemTime')
+            elif event_record_id is None:
+                event_record_id = elem.text
+            elem.clear()
+        
+        return event_id, time_created, event_record_id, data_dict
+    
+    @staticmethod
+    def _fields_etree(root) -> tuple:
+        """Extract key record fields using ElementTree (fallback when lxml is missing)."""
+        # Extract EventID
+        event_id = None
+        event_id_elem = root.find(f'.//{_TAG_EVENT_ID}')
+        if event_id_elem is not None:
+            event_id = event_id_elem.text
+        
+        # Extract TimeCreated
+        time_created = None
+        time_elem = root.find(f'.//{_TAG_TIME_CREATED}')
+        if time_elem is not None:
+            time_created = time_elem.get('SystemTime')
+        
+        # Extract EventRecordID
+        event_record_id = None
+        record_id_elem = root.find(f'.//{_TAG_RECORD_ID}')
+        if record_id_elem is not None:
+            event_record_id = record_id_elem.text
+        
+        # Extract all Data elements
+        data_dict = {}
+        for data_elem in root.findall(f'.//{_TAG_DATA}'):
+            name = data_elem.get('Name')
+            if name and data_elem.text is not None:
+                data_dict[name] = data_elem.text
+        
+        return event_id, time_created, event_record_id, data_dict
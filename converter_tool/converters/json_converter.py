@@ -33,4 +33,11 @@ class JsonConverter(BaseConverter):
             raise
         
         return data
-
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Any:
+        """Parse and validate in-memory JSON content."""
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in {filename}: {e}")
+            raise ValueError(f"Invalid JSON: {e}")
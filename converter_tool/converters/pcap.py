@@ -3,59 +3,227 @@ Converter for network packet capture files (.pcap, .pcapng).
 """
 
 import logging
+import socket
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Union
 
 from ..base_converter import BaseConverter
+from ..utils import IO_BUFFER_SIZE
 
 logger = logging.getLogger(__name__)
 
+# First bytes of a pcapng Section Header Block (classic pcap files start with their own magic)
+PCAPNG_MAGIC = b'\x0a\x0d\x0d\x0a'
+
+# Layers tshark emits in JSON mode; frame carries the timestamp, length and protocol stack
+PYSHARK_LAYERS = "frame ip tcp udp"
+
+# Captures smaller than this skip the tshark subprocess when scapy can read them
+PYSHARK_MIN_SIZE = 4 * 1024 * 1024
+
+
+class PacketColumns:
+    """
+    Packet fields stored column by column ({field: [values]}) instead of one
+    dict per packet, which keeps large captures much smaller in memory and in
+    the JSON output. Fields a packet lacks are None in that packet's row.
+    """
+    
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {}
+        self._count = 0
+    
+    def append(self, packet_obj: Dict[str, Any]) -> None:
+        """Add one packet, given as the dict the row-oriented output would hold."""
+        columns = self.columns
+        count = self._count
+        for key, value in packet_obj.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * count
+            column.append(value)
+        
+        self._count = count = count + 1
+        if len(packet_obj) < len(columns):
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+    
+    def __len__(self) -> int:
+        return self._count
+
 
 class PcapConverter(BaseConverter):
     """Converter for PCAP/PCAPNG files."""
     
-    def _extract_data(self, file_path: Path, max_packets: int = 10000, **kwargs) -> Dict[str, Any]:
+    # Packet dissection in scapy/pyshark is Python code that holds the GIL
+    PARALLELISM = 'cpu'
+    
+    def _extract_data(self, file_path: Path, max_packets: int = 10000, columnar: bool = False,
+                      **kwargs) -> Dict[str, Any]:
         """
         Extract packets from PCAP file.
         
         Args:
             max_packets: Maximum number of packets to extract (default: 10000)
+            columnar: Emit a {field: [values]} mapping instead of per-packet dicts
             
         Returns:
-            Dictionary with 'packets' array
+            Dictionary with 'packets' array (or 'columns' mapping)
         """
-        packets = []
+        last_error: Optional[Exception] = None
         
-        # Try pyshark first
+        # Try dpkt first: it unpacks headers directly, far faster than dissecting
         try:
-            import pyshark
-            return self._extract_with_pyshark(file_path, max_packets)
+            import dpkt
+            return self._extract_with_dpkt(file_path, max_packets, columnar)
         except ImportError:
-            logger.debug("pyshark not available, trying scapy")
+            logger.debug("dpkt not available, trying pyshark")
         except Exception as e:
-            logger.warning(f"pyshark error: {e}, trying scapy fallback")
+            logger.warning(f"dpkt error: {e}, trying pyshark fallback")
+            last_error = e
         
-        # Fallback to scapy
+        # tshark's start-up (a few hundred ms per capture) dwarfs the parsing of a
+        # small capture, so those go to scapy before pyshark
+        scapy_tried = file_path.stat().st_size < PYSHARK_MIN_SIZE
+        if scapy_tried:
+            try:
+                from scapy.all import PcapReader
+                return self._extract_with_scapy(file_path, max_packets, columnar)
+            except ImportError:
+                logger.debug("scapy not available, trying pyshark")
+            except Exception as e:
+                logger.warning(f"scapy error: {e}, trying pyshark fallback")
+                last_error = e
+        
+        # Then pyshark
         try:
-            from scapy.all import rdpcap, PcapReader
-            return self._extract_with_scapy(file_path, max_packets)
+            import pyshark
+            return self._extract_with_pyshark(file_path, max_packets, columnar)
         except ImportError:
-            raise ImportError(
-                "Either pyshark or scapy is required for .pcap files. "
-                "Install with: pip install pyshark (requires tshark) or pip install scapy"
-            )
+            logger.debug("pyshark not available")
+        except Exception as e:
+            logger.warning(f"pyshark error: {e}")
+            last_error = e
+        
+        # Fallback to scapy, unless it already had its turn
+        if not scapy_tried:
+            try:
+                from scapy.all import PcapReader
+                return self._extract_with_scapy(file_path, max_packets, columnar)
+            except ImportError:
+                pass
+        
+        if last_error is not None:
+            raise last_error
+        raise ImportError(
+            "One of dpkt, pyshark or scapy is required for .pcap files. "
+            "Install with: pip install dpkt, pip install pyshark (requires tshark) "
+            "or pip install scapy"
+        )
     
-    def _extract_with_pyshark(self, file_path: Path, max_packets: int) -> Dict[str, Any]:
+    def _extract_with_dpkt(self, file_path: Path, max_packets: int,
+                           columnar: bool = False) -> Dict[str, Any]:
+        """Extract using dpkt, decoding the Ethernet/IP/TCP/UDP headers only."""
+        import dpkt
+        
+        packets = PacketColumns() if columnar else []
+        
+        try:
+            with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+                if f.read(4) == PCAPNG_MAGIC:
+                    reader_class = dpkt.pcapng.Reader
+                else:
+                    reader_class = dpkt.pcap.Reader
+                f.seek(0)
+                
+                reader = reader_class(f)
+                link_decoder = {
+                    dpkt.pcap.DLT_EN10MB: dpkt.ethernet.Ethernet,
+                    dpkt.pcap.DLT_LINUX_SLL: dpkt.sll.SLL,
+                    dpkt.pcap.DLT_RAW: dpkt.ip.IP,
+                }.get(reader.datalink())
+                
+                for i, (ts, buf) in enumerate(reader):
+                    if i >= max_packets:
+                        logger.info(f"Reached max_packets limit ({max_packets}), stopping extraction")
+                        break
+                    
+                    try:
+                        packet_obj = {
+                            "timestamp": float(ts),
+                            "length": len(buf),
+                            "summary": "",
+                        }
+                        
+                        if link_decoder is None:
+                            packets.append(packet_obj)
+                            continue
+                        
+                        frame = link_decoder(buf)
+                        packet_obj["summary"] = self._dpkt_protocols(frame)
+                        ip = frame if link_decoder is dpkt.ip.IP else frame.data
+                        
+                        # Extract IP layer
+                        if isinstance(ip, dpkt.ip.IP):
+                            packet_obj["src_ip"] = socket.inet_ntoa(ip.src)
+                            packet_obj["dst_ip"] = socket.inet_ntoa(ip.dst)
+                            packet_obj["protocol"] = ip.p
+                        elif isinstance(ip, dpkt.ip6.IP6):
+                            packet_obj["src_ip"] = socket.inet_ntop(socket.AF_INET6, ip.src)
+                            packet_obj["dst_ip"] = socket.inet_ntop(socket.AF_INET6, ip.dst)
+                            packet_obj["protocol"] = ip.nxt
+                        else:
+                            packets.append(packet_obj)
+                            continue
+                        
+                        # Extract TCP/UDP ports
+                        l4 = ip.data
+                        if isinstance(l4, (dpkt.tcp.TCP, dpkt.udp.UDP)):
+                            packet_obj["src_port"] = l4.sport
+                            packet_obj["dst_port"] = l4.dport
+                        
+                        packets.append(packet_obj)
+                        
+                    except Exception as e:
+                        logger.warning(f"Error parsing packet {i}: {e}")
+                        continue
+        
+        except Exception as e:
+            logger.error(f"Error reading PCAP file with dpkt {file_path}: {e}")
+            raise
+        
+        return self._result(packets, "dpkt")
+    
+    @staticmethod
+    def _dpkt_protocols(frame) -> str:
+        """Protocol stack of a decoded dpkt frame (e.g. "ethernet:ip:tcp"), like pyshark's."""
+        import dpkt
+        
+        names = []
+        layer = frame
+        while isinstance(layer, dpkt.Packet):
+            names.append(type(layer).__name__.lower())
+            layer = layer.data
+        return ":".join(names)
+    
+    def _extract_with_pyshark(self, file_path: Path, max_packets: int,
+                              columnar: bool = False) -> Dict[str, Any]:
         """Extract using pyshark."""
         import pyshark
         
-        packets = []
+        packets = PacketColumns() if columnar else []
         
         try:
+            # tshark's JSON output parses much faster than the default PDML, and -j
+            # limits dissection output to the layers read below
             cap = pyshark.FileCapture(
                 str(file_path),
                 display_filter=None,
                 keep_packets=False,  # Don't keep all in memory
+                use_json=True,
+                include_raw=False,
+                custom_parameters=["-j", PYSHARK_LAYERS],
             )
             
             for i, packet in enumerate(cap):
@@ -64,29 +232,35 @@ class PcapConverter(BaseConverter):
                     break
                 
                 try:
+                    # Full protocol stack (e.g. "eth:ethertype:ip:tcp:http"), which
+                    # survives the -j layer filter unlike packet.highest_layer.
+                    # Each layer is looked up once: pyshark resolves attributes dynamically
+                    frame_info = getattr(packet, 'frame_info', None)
+                    protocols = getattr(frame_info, 'protocols', "") if frame_info is not None else ""
+                    
                     packet_obj = {
                         "timestamp": float(packet.sniff_timestamp),
-                        "protocol": packet.highest_layer if hasattr(packet, 'highest_layer') else "unknown",
-                        "length": int(packet.length) if hasattr(packet, 'length') else 0,
+                        "protocol": protocols.rsplit(':', 1)[-1].upper() if protocols else "unknown",
+                        "length": int(getattr(packet, 'length', 0)),
                     }
                     
                     # Extract IP layer info if present
-                    if hasattr(packet, 'ip'):
-                        packet_obj["src_ip"] = packet.ip.src if hasattr(packet.ip, 'src') else None
-                        packet_obj["dst_ip"] = packet.ip.dst if hasattr(packet.ip, 'dst') else None
-                        packet_obj["protocol"] = packet.ip.proto if hasattr(packet.ip, 'proto') else None
+                    ip = getattr(packet, 'ip', None)
+                    if ip is not None:
+                        packet_obj["src_ip"] = getattr(ip, 'src', None)
+                        packet_obj["dst_ip"] = getattr(ip, 'dst', None)
+                        packet_obj["protocol"] = getattr(ip, 'proto', None)
                     
-                    # Extract TCP layer info if present
-                    if hasattr(packet, 'tcp'):
-                        packet_obj["src_port"] = int(packet.tcp.srcport) if hasattr(packet.tcp, 'srcport') else None
-                        packet_obj["dst_port"] = int(packet.tcp.dstport) if hasattr(packet.tcp, 'dstport') else None
+                    # Extract TCP, then UDP, layer info if present (UDP wins if both are)
+                    for l4 in (getattr(packet, 'tcp', None), getattr(packet, 'udp', None)):
+                        if l4 is not None:
+                            srcport = getattr(l4, 'srcport', None)
+                            dstport = getattr(l4, 'dstport', None)
+                            packet_obj["src_port"] = int(srcport) if srcport is not None else None
+                            packet_obj["dst_port"] = int(dstport) if dstport is not None else None
                     
-                    # Extract UDP layer info if present
-                    if hasattr(packet, 'udp'):
-                        packet_obj["src_port"] = int(packet.udp.srcport) if hasattr(packet.udp, 'srcport') else None
-                        packet_obj["dst_port"] = int(packet.udp.dstport) if hasattr(packet.udp, 'dstport') else None
-                    
-                    packet_obj["summary"] = str(packet)
+                    # str(packet) re-renders every layer; the protocol stack is cheap
+                    packet_obj["summary"] = protocols
                     packets.append(packet_obj)
                     
                 except Exception as e:
@@ -99,68 +273,68 @@ class PcapConverter(BaseConverter):
             logger.error(f"Error reading PCAP file with pyshark {file_path}: {e}")
             raise
         
-        return {
-            "packet_count": len(packets),
-            "packets": packets,
-            "extraction_method": "pyshark",
-        }
+        return self._result(packets, "pyshark")
     
-    def _extract_with_scapy(self, file_path: Path, max_packets: int) -> Dict[str, Any]:
+    def _extract_with_scapy(self, file_path: Path, max_packets: int,
+                            columnar: bool = False) -> Dict[str, Any]:
         """Extract using scapy."""
         from scapy.all import PcapReader
+        # Layer classes, so lookups don't resolve a layer name on every call
+        from scapy.layers.inet import IP, TCP, UDP
         
-        packets = []
+        packets = PacketColumns() if columnar else []
         
         try:
-            # Use PcapReader for streaming (better for large files)
-            reader = PcapReader(str(file_path))
-            
-            for i, packet in enumerate(reader):
-                if i >= max_packets:
-                    logger.info(f"Reached max_packets limit ({max_packets}), stopping extraction")
-                    break
-                
-                try:
-                    packet_obj = {
-                        "timestamp": float(packet.time),
-                        "length": len(packet),
-                        "summary": packet.summary(),
-                    }
+            # Use PcapReader for streaming (better for large files), over a
+            # file opened with a large read buffer. Small-snaplen captures need no
+            # special casing: scapy reads caplen bytes per record, not a full MTU,
+            # and the buffer turns those small reads into 1 MiB reads
+            with PcapReader(open(file_path, 'rb', buffering=IO_BUFFER_SIZE)) as reader:
+                for i, packet in enumerate(reader):
+                    if i >= max_packets:
+                        logger.info(f"Reached max_packets limit ({max_packets}), stopping extraction")
+                        break
                     
-                    # Extract IP layer
-                    if packet.haslayer("IP"):
-                        ip_layer = packet["IP"]
-                        packet_obj["src_ip"] = ip_layer.src
-                        packet_obj["dst_ip"] = ip_layer.dst
-                        packet_obj["protocol"] = ip_layer.proto
-                    
-                    # Extract TCP layer
-                    if packet.haslayer("TCP"):
-                        tcp_layer = packet["TCP"]
-                        packet_obj["src_port"] = tcp_layer.sport
-                        packet_obj["dst_port"] = tcp_layer.dstport
-                    
-                    # Extract UDP layer
-                    if packet.haslayer("UDP"):
-                        udp_layer = packet["UDP"]
-                        packet_obj["src_port"] = udp_layer.sport
-                        packet_obj["dst_port"] = udp_layer.dstport
-                    
-                    packets.append(packet_obj)
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing packet {i}: {e}")
-                    continue
-            
-            reader.close()
-            
+                    try:
+                        packet_obj = {
+                            "timestamp": float(packet.time),
+                            "length": len(packet),
+                            "summary": packet.summary(),
+                        }
+                        
+                        # Extract IP layer
+                        ip_layer = packet.getlayer(IP)
+                        if ip_layer is not None:
+                            packet_obj["src_ip"] = ip_layer.src
+                            packet_obj["dst_ip"] = ip_layer.dst
+                            packet_obj["protocol"] = ip_layer.proto
+                        
+                        # Extract TCP, then UDP, ports
+                        for l4_class in (TCP, UDP):
+                            l4_layer = packet.getlayer(l4_class)
+                            if l4_layer is not None:
+                                packet_obj["src_port"] = l4_layer.sport
+                                packet_obj["dst_port"] = l4_layer.dport
+                        
+                        packets.append(packet_obj)
+                        
+                    except Exception as e:
+                        logger.warning(f"Error parsing packet {i}: {e}")
+                        continue
+        
         except Exception as e:
             logger.error(f"Error reading PCAP file with scapy {file_path}: {e}")
             raise
         
-        return {
-            "packet_count": len(packets),
-            "packets": packets,
-            "extraction_method": "scapy",
-        }
-
+        return self._result(packets, "scapy")
+    
+    @staticmethod
+    def _result(packets: Union[List[Dict[str, Any]], PacketColumns], method: str) -> Dict[str, Any]:
+        """Build the converted data from the extracted packets."""
+        result = {"packet_count": len(packets)}
+        if isinstance(packets, PacketColumns):
+            result["columns"] = packets.columns
+        else:
+            result["packets"] = packets
+        result["extraction_method"] = method
+        return result
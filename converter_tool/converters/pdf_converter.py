@@ -3,27 +3,69 @@ Converter for PDF files.
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from ..base_converter import BaseConverter
 
 logger = logging.getLogger(__name__)
 
+# When page-level parallelism is enabled (see PdfConverter._extract_data), PDFs
+# with at least this many pages have their layout analysis split into page
+# ranges run in separate processes, using at most MAX_PAGE_WORKERS of them
+PARALLEL_PAGE_THRESHOLD = 20
+MAX_PAGE_WORKERS = 4
+
+
+def _extract_page_texts(file_path: Path, pages: Optional[range] = None) -> List[str]:
+    """
+    Run pdfminer's layout analysis on a range of a PDF's pages (None = all).
+    
+    Module level so it can be pickled for a process pool; each call opens
+    the file itself, since pdfminer page objects can't be sent between processes.
+    
+    Returns:
+        Text of each page, in page order
+    """
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    
+    return [
+        "".join(
+            element.get_text() for element in page_layout
+            if isinstance(element, LTTextContainer)
+        ).strip()
+        for page_layout in extract_pages(file_path, page_numbers=pages,
+                                         maxpages=pages.stop if pages is not None else 0)
+    ]
+
 
 class PdfConverter(BaseConverter):
     """Converter for PDF files."""
     
-    def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
+    # pdfminer's layout analysis is CPU-bound Python, so it runs in a process pool
+    PARALLELISM = 'cpu'
+    
+    def _extract_data(self, file_path: Path, page_workers: int = 1, **kwargs) -> Dict[str, Any]:
         """
         Extract text and metadata from PDF.
         
+        Args:
+            page_workers: Maximum processes to split a long document's pages over
+                (1 = no page-level parallelism). Only honoured in the main
+                process; FileProcessor enables it for inline conversions
+                ('serial' mode or a single input file), where no other
+                process pool is running
+                
         Returns:
             Dictionary with pages array and metadata
         """
         # Try pdfminer.six first
         try:
-            return self._extract_with_pdfminer(file_path)
+            return self._extract_with_pdfminer(file_path, page_workers)
         except ImportError:
             logger.debug("pdfminer.six not available, trying PyPDF2")
         
@@ -36,39 +78,51 @@ class PdfConverter(BaseConverter):
                 "Install with: pip install pdfminer.six or pip install PyPDF2"
             )
     
-    def _extract_with_pdfminer(self, file_path: Path) -> Dict[str, Any]:
-        """Extract using pdfminer.six."""
-        from pdfminer.high_level import extract_text, extract_pages
-        from pdfminer.layout import LTTextContainer
-        
-        pages = []
+    def _extract_with_pdfminer(self, file_path: Path, page_workers: int = 1) -> Dict[str, Any]:
+        """Extract using pdfminer.six, over several processes for long documents."""
+        from pdfminer.pdfpage import PDFPage
         
         try:
-            # Extract text per page
-            for page_num, page_layout in enumerate(extract_pages(str(file_path)), start=1):
-                page_text = ""
-                for element in page_layout:
-                    if isinstance(element, LTTextContainer):
-                        page_text += element.get_text()
-                
-                pages.append({
-                    "page_number": page_num,
-                    "text": page_text.strip(),
-                })
-            
-            # Get total page count
-            full_text = extract_text(str(file_path))
+            workers = 1
+            # Pool workers must not start pools of their own
+            if page_workers > 1 and multiprocessing.parent_process() is None:
+                # Walking the page tree is cheap next to layout analysis
+                with open(file_path, 'rb') as f:
+                    page_count = sum(1 for _ in PDFPage.get_pages(f))
+                workers = self._page_workers(page_count, page_workers)
             
+            if workers > 1:
+                bounds = [page_count * i // workers for i in range(workers + 1)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    ranges = executor.map(_extract_page_texts, [file_path] * workers,
+                                          [range(a, b) for a, b in zip(bounds, bounds[1:])])
+                    texts = [text for page_range in ranges for text in page_range]
+            else:
+                # Extract text per page, in a single layout-analysis pass
+                texts = _extract_page_texts(file_path)
+        
         except Exception as e:
             logger.error(f"Error reading PDF with pdfminer {file_path}: {e}")
             raise
         
+        pages = [
+            {"page_number": page_num, "text": text}
+            for page_num, text in enumerate(texts, start=1)
+        ]
+        
         return {
             "page_count": len(pages),
             "pages": pages,
             "extraction_method": "pdfminer.six",
         }
     
+    @staticmethod
+    def _page_workers(page_count: int, max_workers: int) -> int:
+        """Number of processes to analyse a document's pages with (1 = in this process)."""
+        if page_count < PARALLEL_PAGE_THRESHOLD:
+            return 1
+        return max(1, min(MAX_PAGE_WORKERS, max_workers, os.cpu_count() or 1, page_count // 10))
+    
     def _extract_with_pypdf2(self, file_path: Path) -> Dict[str, Any]:
         """Extract using PyPDF2."""
         import PyPDF2
@@ -2,102 +2,178 @@
 Converter for plain text and log files.
 """
 
+import io
 import logging
 import re
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
 
 from ..base_converter import BaseConverter
+from ..utils import IO_BUFFER_SIZE
 
 logger = logging.getLogger(__name__)
 
+# google-re2 is optional: a linear-time DFA engine with a re-compatible API
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _compile(pattern: str, re_pattern: Optional[str] = None):
+    """
+    Compile a pattern with re2 when installed, falling back to the re module.
+    
+    Args:
+        pattern: Pattern in the syntax shared by re2 and re
+        re_pattern: Equivalent pattern tuned for the re module, which may use
+            lookarounds that re2 lacks (default: pattern)
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.debug(f"re2 could not compile pattern ({e}), using re")
+    return re.compile(re_pattern or pattern)
+
 
 class TextConverter(BaseConverter):
     """Converter for text/log files."""
     
-    # Regex patterns for timestamp detection
-    ISO8601_PATTERN = re.compile(
-        r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?'
+    # Per-line timestamp regexes run in the interpreter, under the GIL
+    PARALLELISM = 'cpu'
+    
+    # Timestamp detection: ISO8601 and epoch alternatives in one pattern, so each
+    # line is scanned once; the named group that matched gives the format
+    _TS_ALTERNATIVES = (
+        r'(?P<iso>\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?)'
+        r'|(?P<epoch>\b\d{10}(?:\.\d+)?\b)'
     )
-    EPOCH_PATTERN = re.compile(r'\b\d{10}(?:\.\d+)?\b')
+    # Both alternatives start with a digit; saying so up front lets re skip every
+    # other position without trying the branches (about twice as fast per line)
+    TS_PATTERN = _compile(_TS_ALTERNATIVES, re_pattern=rf'(?=\d)(?:{_TS_ALTERNATIVES})')
     
     def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """
         Extract lines from text file with optional timestamp detection.
         
+        Returns:
+            Dictionary with 'lines' array
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace',
+                      buffering=IO_BUFFER_SIZE) as f:
+                return self._parse_lines(f)
+        except Exception as e:
+            logger.error(f"Error reading text file {file_path}: {e}")
+            raise
+    
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """Extract lines from in-memory text content."""
+        try:
+            with io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace') as f:
+                return self._parse_lines(f)
+        except Exception as e:
+            logger.error(f"Error reading text content {filename}: {e}")
+            raise
+    
+    def _parse_lines(self, f) -> Dict[str, Any]:
+        """
+        Parse lines from a text stream with optional timestamp detection.
+        
+        Args:
+            f: Text file object
+            
         Returns:
             Dictionary with 'lines' array
         """
         lines = []
+        append = lines.append
+        search = self.TS_PATTERN.search
+        line_num = 0
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                for line_num, line_text in enumerate(f, start=1):
-                    line_obj = {
-                        "line_number": line_num,
-                        "text": line_text.rstrip('\n\r'),
-                    }
-                    
-                    # Try to extract timestamp
-                    timestamp = self._extract_timestamp(line_text)
+        for block in self._iter_blocks(f):
+            # One split per block instead of a readline() call per line
+            for line_text in block.split('\n'):
+                line_num += 1
+                line_obj = {"line_number": line_num, "text": line_text}
+                
+                # Try to extract timestamp (only lines with a candidate are parsed)
+                match = search(line_text)
+                if match:
+                    timestamp = self._extract_timestamp(line_text, match)
                     if timestamp:
                         line_obj["timestamp"] = timestamp
                         line_obj["timestamp_format"] = timestamp.get("format")
-                    
-                    lines.append(line_obj)
-        
-        except Exception as e:
-            logger.error(f"Error reading text file {file_path}: {e}")
-            raise
+                
+                append(line_obj)
         
         return {
             "line_count": len(lines),
             "lines": lines,
         }
     
-    def _extract_timestamp(self, text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _iter_blocks(f) -> Iterator[str]:
+        """
+        Read a text stream in IO_BUFFER_SIZE pieces, yielding blocks of whole lines.
+        
+        Args:
+            f: Text file object in universal newlines mode
+            
+        Returns:
+            Iterator of blocks without their final newline
+        """
+        tail = ''
+        for chunk in iter(partial(f.read, IO_BUFFER_SIZE), ''):
+            chunk = tail + chunk
+            cut = chunk.rfind('\n')
+            if cut < 0:
+                tail = chunk
+                continue
+            yield chunk[:cut]
+            tail = chunk[cut + 1:]
+        
+        if tail:
+            yield tail
+    
+    def _extract_timestamp(self, text: str, match=None) -> Dict[str, Any]:
         """
         Extract timestamp from text line if present.
         
         Args:
             text: Line of text
+            match: First TS_PATTERN match in the line, if the caller already searched
             
         Returns:
             Dictionary with timestamp info or None
         """
-        # Try ISO8601 pattern
-        iso_match = self.ISO8601_PATTERN.search(text)
-        if iso_match:
+        if match is None:
+            match = self.TS_PATTERN.search(text)
+        
+        # The leftmost candidate wins; if it doesn't parse, try the next one
+        while match:
+            raw = match.group()
             try:
-                ts_str = iso_match.group()
-                # Try parsing as ISO8601
-                if 'T' in ts_str:
-                    dt = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
+                if match.lastgroup == 'iso':
+                    # Try parsing as ISO8601
+                    if 'T' in raw:
+                        dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+                    else:
+                        dt = datetime.fromisoformat(raw)
+                    timestamp_format = "iso8601"
                 else:
-                    dt = datetime.fromisoformat(ts_str)
+                    dt = datetime.fromtimestamp(float(raw))
+                    timestamp_format = "epoch"
                 
                 return {
                     "value": dt.isoformat(),
-                    "raw": ts_str,
-                    "format": "iso8601",
+                    "raw": raw,
+                    "format": timestamp_format,
                 }
-            except Exception:
-                pass
-        
-        # Try epoch pattern
-        epoch_match = self.EPOCH_PATTERN.search(text)
-        if epoch_match:
-            try:
-                epoch_float = float(epoch_match.group())
-                dt = datetime.fromtimestamp(epoch_float)
-                return {
-                    "value": dt.isoformat(),
-                    "raw": epoch_match.group(),
-                    "format": "epoch",
-                }
-            except (ValueError, OSError):
-                pass
+            except (ValueError, OSError, OverflowError):
+                match = self.TS_PATTERN.search(text, match.end())
         
         return None
-
@@ -2,18 +2,83 @@
 Converter for XML files.
 """
 
+import io
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from ..base_converter import BaseConverter
+from ..utils import IO_BUFFER_SIZE
 
 logger = logging.getLogger(__name__)
 
 
+class _DictBuilder:
+    """
+    Parser target that builds the dictionary tree straight from parse events,
+    so no Element objects are created at all.
+    
+    Character data is buffered until the next start/end tag, then stored as
+    the open element's text (before its first child) or as the tail of the
+    element that closed last, mirroring ElementTree's text/tail split.
+    """
+    
+    def __init__(self):
+        self._open: List[Dict[str, Any]] = []  # dicts of the open elements
+        self._data: List[str] = []
+        # Last closed element: owner of any data read before the next tag
+        self._closed: Optional[Dict[str, Any]] = None
+        self._root: Optional[Dict[str, Any]] = None
+    
+    def _flush_data(self) -> None:
+        """Assign buffered character data as a text or tail, if not blank."""
+        data = self._data
+        text = data[0] if len(data) == 1 else ''.join(data)
+        data.clear()
+        if text.isspace():
+            return
+        
+        if self._closed is not None:
+            # Handle mixed content (text + elements)
+            self._closed["tail"] = text.strip()
+        else:
+            self._open[-1]["text"] = text.strip()
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if self._data:
+            self._flush_data()
+        
+        node = {
+            "tag": tag,
+            "attributes": dict(attrib) if attrib else {},
+            "text": None,
+        }
+        if self._open:
+            self._open[-1].setdefault("children", []).append(node)
+        self._open.append(node)
+        self._closed = None
+    
+    def end(self, tag: str) -> None:
+        if self._data:
+            self._flush_data()
+        self._closed = self._root = self._open.pop()
+    
+    def data(self, data: str) -> None:
+        self._data.append(data)
+    
+    def close(self) -> Optional[Dict[str, Any]]:
+        if self._data and self._closed is not None:
+            self._flush_data()
+        return self._root
+
+
 class XmlConverter(BaseConverter):
     """Converter for XML files."""
     
+    # Building the dict tree is Python code that holds the GIL
+    PARALLELISM = 'cpu'
+    
     def _extract_data(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """
         Parse XML file and convert to JSON-friendly structure.
@@ -24,9 +89,7 @@ class XmlConverter(BaseConverter):
         import xml.etree.ElementTree as ET
         
         try:
-            tree = ET.parse(str(file_path))
-            root = tree.getroot()
-            return self._element_to_dict(root)
+            return self._parse(str(file_path))
         except ET.ParseError as e:
             logger.error(f"Invalid XML in file {file_path}: {e}")
             raise ValueError(f"Invalid XML: {e}")
@@ -34,33 +97,42 @@ class XmlConverter(BaseConverter):
             logger.error(f"Error reading XML file {file_path}: {e}")
             raise
     
-    def _element_to_dict(self, element) -> Dict[str, Any]:
+    def _extract_data_from_bytes(self, data: bytes, filename: str, **kwargs) -> Dict[str, Any]:
+        """Parse in-memory XML content."""
+        import xml.etree.ElementTree as ET
+        
+        try:
+            return self._parse(io.BytesIO(data))
+        except ET.ParseError as e:
+            logger.error(f"Invalid XML in {filename}: {e}")
+            raise ValueError(f"Invalid XML: {e}")
+    
+    def _parse(self, source) -> Dict[str, Any]:
         """
-        Convert XML element to dictionary recursively.
+        Convert XML to a dictionary tree in one streaming pass.
+        
+        The content is fed to the parser in IO_BUFFER_SIZE chunks and the
+        dicts are built by a parser target as events arrive, so no Element
+        tree is built and the raw document is never held in full.
         
         Args:
-            element: XML Element object
+            source: Path string or binary file object
             
         Returns:
-            Dictionary representation
+            Dictionary representation of the root element, with 'tag',
+            'attributes', 'text' and, when present, 'children' and 'tail'
         """
-        result = {
-            "tag": element.tag,
-            "attributes": dict(element.attrib),
-            "text": element.text.strip() if element.text and element.text.strip() else None,
-        }
-        
-        children = []
-        for child in element:
-            children.append(self._element_to_dict(child))
-        
-        if children:
-            result["children"] = children
+        import xml.etree.ElementTree as ET
         
-        # Handle mixed content (text + elements)
-        tail = element.tail.strip() if element.tail and element.tail.strip() else None
-        if tail:
-            result["tail"] = tail
+        return self._feed(ET.XMLParser(target=_DictBuilder()), source)
+    
+    @staticmethod
+    def _feed(parser, source) -> Dict[str, Any]:
+        """Feed a path's or file object's content to a parser in chunks and close it."""
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                return XmlConverter._feed(parser, f)
         
-        return result
-
+        for chunk in iter(partial(source.read, IO_BUFFER_SIZE), b''):
+            parser.feed(chunk)
+        return parser.close()
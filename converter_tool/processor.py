@@ -2,17 +2,181 @@
 File processing orchestrator with parallel processing support.
 """
 
-import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from stat import S_ISDIR, S_ISREG
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
+from .base_converter import encode_json, utc_timestamp
 from .registry import get_converter
-from .utils import detect_file_type
+from .utils import DEFAULT_HASH_ALGORITHMS, HASH_ALGORITHMS, IO_BUFFER_SIZE, detect_file_type
 
 logger = logging.getLogger(__name__)
 
+PARALLELISM_MODES = ('auto', 'thread', 'process', 'serial')
+
+# Files handed to a process worker per task
+CPU_BATCH_SIZE = 8
+
+# Unfinished tasks allowed per worker before the directory scan waits for results
+MAX_PENDING_PER_WORKER = 4
+
+# The process pool can start while thread pools are running, and forking a
+# multithreaded process may copy locks other threads hold (logging, lru_cache),
+# so its workers come from a fork server (or are spawned where there is none)
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+
+def _convert_one(file_path: Path, stat_result: Optional[os.stat_result] = None,
+                 output_path: Optional[Path] = None, *,
+                 options: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    Convert a single file and write its JSON output.
+    
+    Defined at module level so it can be pickled for process-based execution.
+    
+    Args:
+        file_path: Path to file
+        stat_result: Stat from the directory scan, reused instead of stat() calls
+        output_path: JSON output path reserved for this file (None = <stem>.json
+            in the output directory)
+        options: Processing options (see FileProcessor._worker_options)
+        
+    Returns:
+        Summary of the conversion (source path, output path and detected type),
+        or None if failed/skipped
+    """
+    try:
+        # Detect file type
+        detected_type, mimetype = detect_file_type(file_path, stat_result)
+        
+        # Check format filter
+        formats_filter = options['formats_filter']
+        if formats_filter and detected_type not in formats_filter:
+            logger.debug(f"Skipping {file_path} (type {detected_type} not in filter)")
+            return None
+        
+        # Get converter
+        converter_class = get_converter(detected_type)
+        converter = converter_class(
+            include_base64=options['include_base64'],
+            base64_limit=1024 * 1024,
+        )
+        converter.converted_at = options['converted_at']
+        converter.hash_algorithms = options['hash_algorithms']
+        
+        # Set recursion depth for archives
+        if detected_type in ('zip', 'tar', 'gzip') and hasattr(converter, 'recursion_depth'):
+            converter.recursion_depth = 3
+        
+        # Let archives hand their members to the shared member pool (thread mode only)
+        member_executor = options.get('member_executor')
+        if member_executor is not None and hasattr(converter, 'executor'):
+            converter.executor = member_executor
+            converter.max_pending = options['max_pending_members']
+        
+        # Convert
+        kwargs = {}
+        if detected_type in ('pcap', 'pcapng'):
+            kwargs['max_packets'] = options['max_packets']
+            kwargs['columnar'] = options['pcap_columnar']
+        elif detected_type == 'evtx':
+            kwargs['include_xml'] = options['include_evtx_xml']
+        elif detected_type == 'csv':
+            kwargs['columnar'] = options['csv_columnar']
+        elif detected_type == 'pdf':
+            kwargs['page_workers'] = options.get('page_workers', 1)
+        
+        converted_data = converter.convert(file_path, stat_result=stat_result, **kwargs)
+        
+        # Determine output filename
+        if output_path is None:
+            output_path = options['output_dir'] / (file_path.stem + ".json")
+        
+        # Check if file exists
+        if output_path.exists() and not options['overwrite']:
+            logger.warning(f"Output file exists, skipping: {output_path}")
+            return None
+        
+        # Save JSON
+        converter.save_json(output_path, converted_data)
+        
+        logger.info(f"Converted {file_path.name} -> {output_path.name}")
+        
+        return {
+            "source_path": str(file_path),
+            "output_path": str(output_path),
+            "detected_type": detected_type,
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to process {file_path}: {e}", exc_info=True)
+        return None
+
+
+def _init_worker(level: int, formatter: Optional[logging.Formatter]) -> None:
+    """Process pool initializer: log like the parent, whose handlers a fresh process lacks."""
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    if formatter is not None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+
+
+def _scan_files(root: Path, exclude: Optional[str] = None) -> Iterator[Tuple[Path, os.stat_result]]:
+    """
+    Recursively yield regular files under root together with their stat results.
+    
+    Uses os.scandir, so directory entries are classified without extra
+    syscalls and each file is stat()ed exactly once. Files are yielded as
+    each directory is read, so conversion can start before the walk ends.
+    Symlinked directories are not followed.
+    
+    Args:
+        root: Directory to walk
+        exclude: Path of a subdirectory (as root-joined string) to skip
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path == exclude:
+                            continue
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        yield Path(entry.path), entry.stat()
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {directory}: {e}")
+
+
+def _convert_batch(batch: List[Tuple[Path, Optional[os.stat_result], Path]], *,
+                   options: Dict[str, Any]) -> List[Optional[Dict[str, str]]]:
+    """Convert several files in one task, so process workers aren't fed one pickle per file."""
+    return [_convert_one(file_path, stat_result, output_path, options=options)
+            for file_path, stat_result, output_path in batch]
+
+
+def _copy_indented(src: Path, dst, prefix: bytes, chunk_size: int = 1 << 20) -> None:
+    """Copy a pretty-printed JSON file, indenting every line (newlines are structural only)."""
+    dst.write(prefix)
+    with open(src, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            dst.write(chunk.replace(b'\n', b'\n' + prefix))
+
 
 class FileProcessor:
     """Orchestrates file conversion with parallel processing."""
@@ -25,6 +189,11 @@ class FileProcessor:
         workers: Optional[int] = None,
         max_packets: int = 10000,
         include_base64: bool = False,
+        include_evtx_xml: bool = False,
+        parallelism: str = 'auto',
+        csv_columnar: bool = False,
+        pcap_columnar: bool = False,
+        legacy_hashes: bool = False,
     ):
         """
         Initialize file processor.
@@ -36,18 +205,40 @@ class FileProcessor:
             workers: Number of worker threads (None = CPU count)
             max_packets: Maximum packets to extract from PCAP files
             include_base64: Include base64 preview for binary files
+            include_evtx_xml: Include the raw XML of each EVTX record
+            parallelism: Execution mode - 'auto' (route each file by its converter's
+                PARALLELISM), 'thread', 'process' or 'serial'
+            csv_columnar: Emit CSV data as {column: [values]} instead of per-row dicts
+            pcap_columnar: Emit PCAP packets as {field: [values]} instead of per-packet dicts
+            legacy_hashes: Also compute the SHA1 and MD5 digests (only SHA256,
+                plus BLAKE3 when installed, is computed otherwise)
         """
+        if parallelism not in PARALLELISM_MODES:
+            raise ValueError(f"Unknown parallelism mode: {parallelism}")
+        
         self.output_dir = Path(output_dir)
         self.overwrite = overwrite
         self.formats_filter = formats_filter
         self.max_packets = max_packets
         self.include_base64 = include_base64
+        self.include_evtx_xml = include_evtx_xml
+        self.parallelism = parallelism
+        self.csv_columnar = csv_columnar
+        self.pcap_columnar = pcap_columnar
+        self.legacy_hashes = legacy_hashes
+        
+        # One converted_at timestamp for the whole run instead of one clock read per file
+        self._run_started = utc_timestamp()
         
-        import os
         self.workers = workers or os.cpu_count() or 1
         
-        self.converted_files: List[Dict] = []
+        # Summary of every converted file; the outputs themselves are copied into
+        # a spool for master.json as soon as each one is recorded
+        self.converted_files: List[Dict[str, str]] = []
         self.failed_files: List[Dict] = []
+        self._master_spool = None
+        # Output names handed out in this run, so inputs sharing a stem don't collide
+        self._output_names: Set[str] = set()
     
     def process(self, input_path: Path) -> Dict[str, int]:
         """
@@ -61,119 +252,262 @@ class FileProcessor:
         """
         input_path = Path(input_path)
         
-        if input_path.is_file():
-            files_to_process = [input_path]
-        elif input_path.is_dir():
-            files_to_process = list(input_path.rglob('*'))
-            files_to_process = [f for f in files_to_process if f.is_file()]
+        # One stat() decides the input kind and is reused for a single file
+        try:
+            input_stat = input_path.stat()
+        except OSError:
+            input_stat = None
+        
+        single = input_stat is not None and S_ISREG(input_stat.st_mode)
+        if single:
+            scanned = iter([(input_path, input_stat)])
+        elif input_stat is not None and S_ISDIR(input_stat.st_mode):
+            # The walk is lazy, so JSON written under the input tree must be kept out of it
+            try:
+                nested = self.output_dir.resolve().relative_to(input_path.resolve())
+            except ValueError:
+                nested = None
+            if nested is None:
+                scanned = _scan_files(input_path)
+            elif nested.parts:
+                scanned = _scan_files(input_path, exclude=os.path.join(input_path, *nested.parts))
+            else:
+                # Output goes next to the input files: list them all before converting
+                scanned = iter(list(_scan_files(input_path)))
         else:
             raise ValueError(f"Input path is neither file nor directory: {input_path}")
         
-        if not files_to_process:
-            logger.warning(f"No files found in {input_path}")
-            return {"successful": 0, "failed": 0}
-        
-        logger.info(f"Found {len(files_to_process)} files to process")
+        file_count = self._run(scanned, self._worker_options(), single=single)
         
-        # Process files in parallel
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            future_to_file = {
-                executor.submit(self._process_single_file, file_path): file_path
-                for file_path in files_to_process
-            }
-            
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    if result:
-                        self.converted_files.append(result)
-                except Exception as e:
-                    logger.error(f"Error processing {file_path}: {e}")
-                    self.failed_files.append({
-                        "file": str(file_path),
-                        "error": str(e),
-                    })
+        if not file_count:
+            logger.warning(f"No files found in {input_path}")
+        else:
+            logger.info(f"Processed {file_count} files")
         
         return {
             "successful": len(self.converted_files),
             "failed": len(self.failed_files),
         }
     
-    def _process_single_file(self, file_path: Path) -> Optional[Dict]:
+    def _route(self, file_path: Path, stat_result: Optional[os.stat_result]) -> str:
         """
-        Process a single file.
+        Pick how a file is converted: 'cpu' (process pool), 'io' (thread pool)
+        or 'serial' (inline). In 'auto' mode this is the PARALLELISM its
+        converter declares.
+        """
+        if self.parallelism == 'serial' or self.workers <= 1:
+            return 'serial'
+        if self.parallelism == 'process':
+            return 'cpu'
+        if self.parallelism == 'thread':
+            return 'io'
+        
+        detected_type, _ = detect_file_type(file_path, stat_result)
+        return get_converter(detected_type).PARALLELISM
+    
+    def _run(self, scanned: Iterator[Tuple[Path, Optional[os.stat_result]]],
+             options: Dict[str, Any], single: bool = False) -> int:
+        """
+        Convert files as the scan yields them: 'cpu' files in a process pool
+        (in batches of CPU_BATCH_SIZE), 'io' files in a thread pool and 'serial'
+        files inline. Pools are started on their first file and run concurrently.
+        
+        Results are recorded as tasks finish; once MAX_PENDING_PER_WORKER tasks
+        per worker are outstanding the scan waits, so a large tree never has
+        all of its files queued at once.
         
         Args:
-            file_path: Path to file
-            
+            scanned: Files to convert, with their stat results
+            options: Processing options (see _worker_options)
+            single: The input is a single file; a 'cpu' file is then converted
+                inline instead of in a process pool of its own
+                
         Returns:
-            Converted data dictionary or None if failed/skipped
+            Number of files scanned
         """
-        try:
-            # Detect file type
-            detected_type, mimetype = detect_file_type(file_path)
-            
-            # Check format filter
-            if self.formats_filter and detected_type not in self.formats_filter:
-                logger.debug(f"Skipping {file_path} (type {detected_type} not in filter)")
-                return None
-            
-            # Get converter
-            converter_class = get_converter(detected_type)
-            converter = converter_class(
-                include_base64=self.include_base64,
-                base64_limit=1024 * 1024,
-            )
-            
-            # Set recursion depth for archives
-            if detected_type in ('zip', 'tar', 'gzip') and hasattr(converter, 'recursion_depth'):
-                converter.recursion_depth = 3
-            
-            # Convert
-            kwargs = {}
-            if detected_type in ('pcap', 'pcapng'):
-                kwargs['max_packets'] = self.max_packets
-            
-            converted_data = converter.convert(file_path, **kwargs)
-            
-            # Determine output filename
-            output_filename = file_path.stem + ".json"
-            output_path = self.output_dir / output_filename
-            
-            # Check if file exists
-            if output_path.exists() and not self.overwrite:
-                logger.warning(f"Output file exists, skipping: {output_path}")
-                return None
-            
-            # Save JSON
-            converter.save_json(output_path, converted_data)
+        # PDFs only run inline in serial mode or as the single input, where no
+        # process pool is alive, so long ones may split their pages over processes
+        convert = partial(_convert_one, options=dict(options, page_workers=self.workers))
+        
+        with ExitStack() as stack:
+            pools: Dict[str, Executor] = {}
+            # Submitted work in scan order: (files, future or finished results)
+            submitted: Deque[Tuple[List[Path], Any]] = deque()
+            max_pending = self.workers * MAX_PENDING_PER_WORKER
+            batch: List[Tuple[Path, Optional[os.stat_result], Path]] = []
+            file_count = 0
             
-            logger.info(f"Converted {file_path.name} -> {output_filename}")
+            for file_path, stat_result in scanned:
+                file_count += 1
+                route = self._route(file_path, stat_result)
+                if single and route == 'cpu':
+                    route = 'serial'
+                output_path = self._reserve_output_path(file_path)
+                
+                if route == 'cpu':
+                    batch.append((file_path, stat_result, output_path))
+                    if len(batch) >= CPU_BATCH_SIZE:
+                        submitted.append(self._submit_batch(stack, pools, batch, options))
+                        batch = []
+                elif route == 'io':
+                    if 'io' not in pools:
+                        # Archive members are converted on a separate pool: a top-level worker
+                        # waiting on members queued behind other top-level files would deadlock
+                        member_executor = stack.enter_context(ThreadPoolExecutor(max_workers=self.workers))
+                        pools['io'] = stack.enter_context(ThreadPoolExecutor(max_workers=self.workers))
+                        io_convert = partial(_convert_batch, options=dict(
+                            options, member_executor=member_executor, max_pending_members=self.workers * 2))
+                    submitted.append(([file_path], pools['io'].submit(
+                        io_convert, [(file_path, stat_result, output_path)])))
+                else:
+                    submitted.append(([file_path], [convert(file_path, stat_result, output_path)]))
+                
+                self._drain(submitted, max_pending)
             
-            return converted_data
+            if batch:
+                submitted.append(self._submit_batch(stack, pools, batch, options))
             
+            self._drain(submitted, 0)
+        
+        return file_count
+    
+    def _submit_batch(self, stack: ExitStack, pools: Dict[str, Executor],
+                      batch: List[Tuple[Path, Optional[os.stat_result], Path]],
+                      options: Dict[str, Any]) -> Tuple[List[Path], Future]:
+        """Queue a batch of 'cpu' files on the process pool, starting it if needed."""
+        if 'cpu' not in pools:
+            root_logger = logging.getLogger()
+            # Plain formatters only: others may hold unpicklable streams
+            formatter = next((h.formatter for h in root_logger.handlers
+                              if type(h.formatter) is logging.Formatter), None)
+            pools['cpu'] = stack.enter_context(ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=_MP_CONTEXT,
+                initializer=_init_worker, initargs=(root_logger.level, formatter),
+            ))
+        future = pools['cpu'].submit(partial(_convert_batch, options=options), batch)
+        return [file_path for file_path, _, _ in batch], future
+    
+    def _reserve_output_path(self, file_path: Path) -> Path:
+        """
+        Pick the JSON output path for a file: <stem>.json, or <stem>_<n>.json
+        when an earlier file of this run already took that name.
+        """
+        name = file_path.stem + ".json"
+        n = 0
+        while name in self._output_names:
+            n += 1
+            name = f"{file_path.stem}_{n}.json"
+        if n:
+            logger.warning(f"Output name {file_path.stem}.json already used in this run, "
+                           f"writing {file_path.name} to {name}")
+        self._output_names.add(name)
+        return self.output_dir / name
+    
+    def _worker_options(self) -> Dict[str, Any]:
+        """Build the picklable option set passed to each conversion task."""
+        return {
+            "output_dir": self.output_dir,
+            "overwrite": self.overwrite,
+            "formats_filter": self.formats_filter,
+            "max_packets": self.max_packets,
+            "include_base64": self.include_base64,
+            "include_evtx_xml": self.include_evtx_xml,
+            "csv_columnar": self.csv_columnar,
+            "pcap_columnar": self.pcap_columnar,
+            "hash_algorithms": HASH_ALGORITHMS if self.legacy_hashes else DEFAULT_HASH_ALGORITHMS,
+            "converted_at": self._run_started,
+        }
+    
+    def _drain(self, submitted: Deque[Tuple[List[Path], Any]], max_pending: int) -> None:
+        """
+        Record finished work from the head of the queue, in submission order.
+        
+        Args:
+            submitted: Submitted work as (files, future or finished results)
+            max_pending: Wait for the oldest task while more than this many are queued
+        """
+        while submitted:
+            files, outcome = submitted[0]
+            if isinstance(outcome, Future) and not outcome.done() and len(submitted) <= max_pending:
+                return
+            submitted.popleft()
+            self._collect(files, outcome)
+    
+    def _collect(self, files: List[Path], outcome: Any) -> None:
+        """
+        Record the results of one submitted unit of work.
+        
+        Args:
+            files: Files the work covered
+            outcome: Future, or the list of results of work done inline
+        """
+        try:
+            results = outcome.result() if isinstance(outcome, Future) else outcome
         except Exception as e:
-            logger.error(f"Failed to process {file_path}: {e}", exc_info=True)
-            return None
+            for file_path in files:
+                logger.error(f"Error processing {file_path}: {e}")
+                self.failed_files.append({
+                    "file": str(file_path),
+                    "error": str(e),
+                })
+            return
+        
+        for result in results:
+            if result:
+                self._record(result)
+    
+    def _record(self, result: Dict[str, str]) -> None:
+        """Add a conversion summary and copy its output into the master.json spool."""
+        if self._master_spool is None:
+            self._master_spool = tempfile.TemporaryFile()
+        if self.converted_files:
+            self._master_spool.write(b',\n')
+        try:
+            _copy_indented(Path(result["output_path"]), self._master_spool, b'    ')
+        except OSError as e:
+            # Keep the spool a valid JSON array even if the output vanished
+            logger.error(f"Cannot read {result['output_path']} for master.json: {e}")
+            self._master_spool.write(b'    null')
+        self.converted_files.append(result)
+    
+    def _process_single_file(self, file_path: Path) -> Optional[Dict[str, str]]:
+        """
+        Process a single file.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            Conversion summary or None if failed/skipped
+        """
+        return _convert_one(file_path, options=self._worker_options())
     
     def create_master_json(self, output_path: Path) -> None:
         """
         Create a master JSON file combining all converted files.
         
+        The per-file JSON outputs were spooled as each conversion was
+        recorded, so they are copied in as produced, without being encoded a
+        second time or held in memory.
+        
         Args:
             output_path: Path for master.json file
         """
-        master_data = {
-            "total_files": len(self.converted_files),
-            "converted_files": self.converted_files,
-        }
-        
-        if self.failed_files:
-            master_data["failed_files"] = self.failed_files
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(master_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(b'{\n  "total_files": %d,\n  "converted_files": [' % len(self.converted_files))
+            if self.converted_files:
+                f.write(b'\n')
+                self._master_spool.seek(0)
+                shutil.copyfileobj(self._master_spool, f, IO_BUFFER_SIZE)
+                self._master_spool.seek(0, os.SEEK_END)
+                f.write(b'\n  ]')
+            else:
+                f.write(b']')
+            
+            if self.failed_files:
+                failed = encode_json(self.failed_files, pretty=True)
+                f.write(b',\n  "failed_files": ' + failed.replace(b'\n', b'\n  '))
+            
+            f.write(b'\n}')
         
         logger.info(f"Created master.json with {len(self.converted_files)} entries")
-
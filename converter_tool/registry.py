@@ -2,49 +2,43 @@
 Registry for mapping file types to converter classes.
 """
 
-from typing import Dict, Type
+import functools
+import importlib
+from typing import Dict, Tuple, Type
 
 from .base_converter import BaseConverter
-from .converters import (
-    ArchiveConverter,
-    BinaryConverter,
-    CsvConverter,
-    DocxConverter,
-    EvtxConverter,
-    JsonConverter,
-    PcapConverter,
-    PdfConverter,
-    TextConverter,
-    XmlConverter,
-)
 
-# Map detected types to converter classes
-CONVERTER_REGISTRY: Dict[str, Type[BaseConverter]] = {
-    'evtx': EvtxConverter,
-    'pcap': PcapConverter,
-    'pcapng': PcapConverter,
-    'csv': CsvConverter,
-    'json': JsonConverter,
-    'xml': XmlConverter,
-    'txt': TextConverter,
-    'pdf': PdfConverter,
-    'docx': DocxConverter,
-    'zip': ArchiveConverter,
-    'tar': ArchiveConverter,
-    'gzip': ArchiveConverter,
-    'binary': BinaryConverter,
+# Map detected types to (module, class name) of their converter. Modules are
+# imported on first use, so the backends of formats that never show up (scapy,
+# pdfminer, lxml, ...) are never loaded
+CONVERTER_REGISTRY: Dict[str, Tuple[str, str]] = {
+    'evtx': ('.converters.evtx', 'EvtxConverter'),
+    'pcap': ('.converters.pcap', 'PcapConverter'),
+    'pcapng': ('.converters.pcap', 'PcapConverter'),
+    'csv': ('.converters.csv_converter', 'CsvConverter'),
+    'json': ('.converters.json_converter', 'JsonConverter'),
+    'xml': ('.converters.xml_converter', 'XmlConverter'),
+    'txt': ('.converters.text_converter', 'TextConverter'),
+    'pdf': ('.converters.pdf_converter', 'PdfConverter'),
+    'docx': ('.converters.docx_converter', 'DocxConverter'),
+    'zip': ('.converters.archive_converter', 'ArchiveConverter'),
+    'tar': ('.converters.archive_converter', 'ArchiveConverter'),
+    'gzip': ('.converters.archive_converter', 'ArchiveConverter'),
+    'binary': ('.converters.binary_converter', 'BinaryConverter'),
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_converter(file_type: str) -> Type[BaseConverter]:
     """
-    Get converter class for a file type.
+    Get converter class for a file type, importing its module on first use.
     
     Args:
         file_type: Detected file type (e.g., 'evtx', 'pcap', 'csv')
         
     Returns:
-        Converter class
+        Converter class (BinaryConverter for unknown types)
     """
-    return CONVERTER_REGISTRY.get(file_type, BinaryConverter)
-
+    module_name, class_name = CONVERTER_REGISTRY.get(file_type, CONVERTER_REGISTRY['binary'])
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name)
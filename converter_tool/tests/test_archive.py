@@ -0,0 +1,119 @@
+"""Tests for archive converter."""
+
+import io
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from converter.converters.archive_converter import ArchiveConverter
+
+
+def test_zip_conversion(tmp_path):
+    """Test ZIP archive conversion with in-memory member conversion."""
+    archive_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(archive_path, 'w') as zf:
+        zf.writestr("data.csv", "name,age\nAlice,30\n")
+        zf.writestr("notes.json", '{"key": "value"}')
+    
+    converter = ArchiveConverter()
+    result = converter.convert(archive_path)
+    
+    assert result["detected_type"] == "zip"
+    data = result["data"]
+    assert data["file_count"] == 2
+    
+    members = {f["filename"]: f for f in data["files"]}
+    assert members["data.csv"]["converted_content"]["rows"][0]["name"] == "Alice"
+    assert members["notes.json"]["converted_content"] == {"key": "value"}
+
+
+def test_nested_zip_conversion(tmp_path):
+    """Test that nested archives are converted without temporary files."""
+    inner_path = tmp_path / "inner.zip"
+    with zipfile.ZipFile(inner_path, 'w') as zf:
+        zf.writestr("log.txt", "Line 1\nLine 2\n")
+    
+    outer_path = tmp_path / "outer.zip"
+    with zipfile.ZipFile(outer_path, 'w') as zf:
+        zf.write(inner_path, "inner.zip")
+    
+    converter = ArchiveConverter()
+    result = converter.convert(outer_path)
+    
+    inner = result["data"]["files"][0]["converted_content"]
+    assert inner["archive_type"] == "zip"
+    assert inner["files"][0]["converted_content"]["line_count"] == 2
+
+
+def test_zip_skips_binary_members(tmp_path):
+    """Test that members with binary suffixes are listed but not converted."""
+    archive_path = tmp_path / "build.zip"
+    with zipfile.ZipFile(archive_path, 'w') as zf:
+        zf.writestr("tool.exe", "name,age\nAlice,30\n")
+        zf.writestr("data.csv", "name,age\nAlice,30\n")
+    
+    converter = ArchiveConverter()
+    result = converter.convert(archive_path)
+    
+    members = {f["filename"]: f for f in result["data"]["files"]}
+    assert members["tool.exe"]["size"] > 0
+    assert "converted_content" not in members["tool.exe"]
+    assert "converted_content" in members["data.csv"]
+
+
+def test_tar_gz_conversion(tmp_path):
+    """Test streaming TAR.GZ archive conversion."""
+    archive_path = tmp_path / "test.tar.gz"
+    with tarfile.open(archive_path, 'w:gz') as tf:
+        for name, content in (("a.csv", b"a,b\n1,2\n"), ("b.txt", b"Line 1\n")):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            tf.addfile(info, io.BytesIO(content))
+    
+    converter = ArchiveConverter()
+    result = converter.convert(archive_path)
+    
+    data = result["data"]
+    assert data["archive_type"] == "tar"
+    assert [f["filename"] for f in data["files"]] == ["a.csv", "b.txt"]
+    assert data["files"][0]["converted_content"]["row_count"] == 1
+    assert data["files"][1]["converted_content"]["line_count"] == 1
+
+
+def test_zip_conversion_with_executor(tmp_path):
+    """Test that members converted on a pool match inline conversion."""
+    archive_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(archive_path, 'w') as zf:
+        for i in range(10):
+            zf.writestr(f"data{i}.csv", f"name,index\nrow,{i}\n")
+    
+    inline = ArchiveConverter().convert(archive_path)["data"]
+    
+    converter = ArchiveConverter()
+    converter.max_pending = 2
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        converter.executor = executor
+        pooled = converter.convert(archive_path)["data"]
+    
+    assert pooled == inline
+    assert pooled["files"][9]["converted_content"]["rows"][0]["index"] == "9"
+
+
+def test_archive_listing_streamed_to_json(tmp_path):
+    """Test that the streamed file listing saves the same JSON as a plain list."""
+    import json
+    
+    archive_path = tmp_path / "test.zip"
+    with zipfile.ZipFile(archive_path, 'w') as zf:
+        zf.writestr("data.csv", "name,age\nAlice,30\n")
+        zf.writestr("empty/", "")
+    
+    converter = ArchiveConverter()
+    result = converter.convert(archive_path)
+    
+    output_path = tmp_path / "test.json"
+    converter.save_json(output_path, result)
+    
+    saved = json.loads(output_path.read_text(encoding='utf-8'))
+    assert saved["data"]["files"] == list(result["data"]["files"])
+    assert output_path.read_text(encoding='utf-8') == json.dumps(saved, indent=2, ensure_ascii=False)
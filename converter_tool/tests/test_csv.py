@@ -1,7 +1,6 @@
 """Tests for CSV converter."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,48 +8,74 @@ import pytest
 from converter.converters.csv_converter import CsvConverter
 
 
-def test_csv_conversion():
+def test_csv_conversion(tmp_path):
     """Test CSV file conversion."""
     # Create a test CSV file
     csv_content = "name,age,city\nAlice,30,New York\nBob,25,San Francisco\n"
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(csv_content)
-        temp_path = Path(f.name)
-    
-    try:
-        converter = CsvConverter()
-        result = converter.convert(temp_path)
-        
-        assert result["detected_type"] == "csv"
-        assert result["source_filename"] == temp_path.name
-        assert "data" in result
-        
-        data = result["data"]
-        assert data["row_count"] == 2
-        assert len(data["rows"]) == 2
-        assert data["rows"][0]["name"] == "Alice"
-        assert data["rows"][0]["age"] == "30"
-        assert data["rows"][1]["name"] == "Bob"
-    finally:
-        temp_path.unlink()
-
-
-def test_csv_empty():
+    temp_path = tmp_path / "test.csv"
+    temp_path.write_text(csv_content)
+    
+    converter = CsvConverter()
+    result = converter.convert(temp_path)
+    
+    assert result["detected_type"] == "csv"
+    assert result["source_filename"] == temp_path.name
+    assert "data" in result
+    
+    data = result["data"]
+    assert data["row_count"] == 2
+    assert len(data["rows"]) == 2
+    assert data["rows"][0]["name"] == "Alice"
+    assert data["rows"][0]["age"] == "30"
+    assert data["rows"][1]["name"] == "Bob"
+
+
+def test_csv_empty(tmp_path):
     """Test CSV with only headers."""
     csv_content = "name,age\n"
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(csv_content)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.csv"
+    temp_path.write_text(csv_content)
+    
+    converter = CsvConverter()
+    result = converter.convert(temp_path)
+    
+    data = result["data"]
+    assert data["row_count"] == 0
+    assert len(data["rows"]) == 0
+
+
+
+def test_csv_columnar(tmp_path):
+    """Test columnar CSV output."""
+    csv_content = "name,age\nAlice,30\nBob,25\n"
+    
+    temp_path = tmp_path / "test.csv"
+    temp_path.write_text(csv_content)
+    
+    converter = CsvConverter()
+    result = converter.convert(temp_path, columnar=True)
     
-    try:
-        converter = CsvConverter()
-        result = converter.convert(temp_path)
-        
-        data = result["data"]
-        assert data["row_count"] == 0
-        assert len(data["rows"]) == 0
-    finally:
-        temp_path.unlink()
+    data = result["data"]
+    assert data["row_count"] == 2
+    assert "rows" not in data
+    assert data["columns"] == {"name": ["Alice", "Bob"], "age": ["30", "25"]}
 
+
+def test_csv_utf8_bom(tmp_path):
+    """Test that a BOM-prefixed CSV gives the same rows as csv.DictReader."""
+    import csv
+    import io
+    
+    content = "\ufeffid,name\n1,Alice\n2,Bob\n".encode('utf-8')
+    temp_path = tmp_path / "bom.csv"
+    temp_path.write_bytes(content)
+    
+    expected = list(csv.DictReader(io.StringIO(content.decode('utf-8'))))
+    
+    converter = CsvConverter()
+    data = converter.convert(temp_path)["data"]
+    assert data["column_names"] == ["\ufeffid", "name"]
+    assert data["rows"] == expected
+    assert converter._extract_data_from_bytes(content, "bom.csv")["rows"] == expected
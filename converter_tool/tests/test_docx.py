@@ -0,0 +1,152 @@
+"""Tests for DOCX converter."""
+
+import posixpath
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from converter.converters import docx_converter
+from converter.converters.docx_converter import DocxConverter
+
+# Package skeleton, formatted with the document part's name (and its styles part's target)
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/{document_part}" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/{styles_part}" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '</Types>'
+)
+
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="{document_part}"/>'
+    '</Relationships>'
+)
+
+DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="{styles_target}"/>'
+    '</Relationships>'
+)
+
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>'
+    '</w:styles>'
+)
+
+# Paragraphs exercising run content python-docx renders specially or skips
+BODY = (
+    # Page break: no text; line break: newline
+    '<w:p><w:r><w:t>before</w:t><w:br w:type="page"/><w:t>after</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>line</w:t><w:br/><w:t>wrap</w:t></w:r></w:p>'
+    # Tracked insertion and simple field: not part of Paragraph.text
+    '<w:p><w:r><w:t>keep</w:t></w:r>'
+    '<w:ins w:id="1" w:author="a"><w:r><w:t>INSERTED</w:t></w:r></w:ins>'
+    '<w:fldSimple w:instr="PAGE"><w:r><w:t>7</w:t></w:r></w:fldSimple></w:p>'
+    # Hyperlink runs, tab, soft return and non-breaking hyphen
+    '<w:p><w:r><w:t xml:space="preserve">see </w:t></w:r>'
+    '<w:hyperlink><w:r><w:t>link</w:t></w:r></w:hyperlink>'
+    '<w:r><w:tab/><w:t>a</w:t><w:noBreakHyphen/><w:t>b</w:t><w:cr/><w:t>c</w:t></w:r></w:p>'
+    # Text box with a fallback: neither copy is paragraph text
+    '<w:p><w:r><w:t>outer</w:t></w:r><w:r><mc:AlternateContent><mc:Choice Requires="wps">'
+    '<w:drawing><w:txbxContent><w:p><w:r><w:t>box</w:t></w:r></w:p></w:txbxContent></w:drawing>'
+    '</mc:Choice><mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>box</w:t></w:r></w:p>'
+    '</w:txbxContent></w:pict></mc:Fallback></mc:AlternateContent></w:r></w:p>'
+)
+
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+    f'<w:body>{BODY}</w:body></w:document>'
+)
+
+
+def _write_docx(path: Path, document: str = DOCUMENT,
+                document_part: str = 'word/document.xml', styles_target: str = 'styles.xml') -> Path:
+    directory, name = posixpath.split(document_part)
+    styles_part = posixpath.normpath(posixpath.join(directory, styles_target))
+    names = dict(document_part=document_part, styles_part=styles_part, styles_target=styles_target)
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('[Content_Types].xml', CONTENT_TYPES.format(**names))
+        zf.writestr('_rels/.rels', RELS.format(**names))
+        zf.writestr(document_part, document)
+        zf.writestr(posixpath.join(directory, '_rels', name + '.rels'), DOCUMENT_RELS.format(**names))
+        zf.writestr(styles_part, STYLES)
+    return path
+
+
+def _texts(result):
+    return [p["text"] for p in result["paragraphs"]]
+
+
+def test_docx_run_content(tmp_path):
+    """Test that paragraph text follows python-docx's run content rules."""
+    pytest.importorskip("lxml")
+    docx_path = _write_docx(tmp_path / "runs.docx")
+    
+    result = DocxConverter()._extract_data(docx_path)
+    
+    assert _texts(result) == [
+        "beforeafter",
+        "line\nwrap",
+        "keep",
+        "see link\ta-b\nc",
+        "outer",
+    ]
+
+
+def test_docx_lxml_matches_python_docx(tmp_path, monkeypatch):
+    """Test that the lxml reader gives the same paragraphs as python-docx."""
+    pytest.importorskip("lxml")
+    pytest.importorskip("docx")
+    docx_path = _write_docx(tmp_path / "runs.docx")
+    
+    fast = DocxConverter()._extract_data(docx_path)
+    monkeypatch.setattr(docx_converter, "lxml_etree", None)
+    reference = DocxConverter()._extract_data(docx_path)
+    
+    assert fast == reference
+
+
+@pytest.mark.parametrize("document_part, styles_target", [
+    ("word/document.xml", "styles.xml"),
+    ("content/main.xml", "../shared/styles.xml"),
+])
+def test_docx_part_names_from_relationships(tmp_path, document_part, styles_target):
+    """Test that the document and styles parts are found through the package relationships."""
+    pytest.importorskip("lxml")
+    docx_path = _write_docx(tmp_path / "parts.docx", document_part=document_part,
+                            styles_target=styles_target)
+    
+    result = DocxConverter()._extract_data(docx_path)
+    
+    assert result["paragraph_count"] == 5
+    assert {p["style"] for p in result["paragraphs"]} == {"Normal"}
+
+
+def test_docx_entities_not_expanded(tmp_path):
+    """Test that DTD entities in a document part are not expanded."""
+    pytest.importorskip("lxml")
+    document = DOCUMENT.replace(
+        '<w:document ', '<!DOCTYPE w:document [<!ENTITY boom "expanded">]><w:document ', 1,
+    ).replace('<w:t>keep</w:t>', '<w:t>keep&boom;</w:t>', 1)
+    docx_path = _write_docx(tmp_path / "entity.docx", document=document)
+    
+    result = DocxConverter()._extract_data(docx_path)
+    
+    assert "keep" in _texts(result)
+    assert not any("expanded" in text for text in _texts(result))
@@ -1,7 +1,6 @@
 """Integration tests for the CLI and full workflow."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -9,109 +8,216 @@ import pytest
 from converter.processor import FileProcessor
 
 
-def test_process_single_csv():
+def test_process_single_csv(tmp_path):
     """Test processing a single CSV file."""
     csv_content = "name,value\nitem1,10\nitem2,20\n"
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create input file
-        input_file = Path(tmpdir) / "test.csv"
-        input_file.write_text(csv_content)
-        
-        # Create output directory
-        output_dir = Path(tmpdir) / "output"
-        output_dir.mkdir()
-        
-        # Process
-        processor = FileProcessor(output_dir=output_dir)
-        results = processor.process(input_file)
-        
-        assert results["successful"] == 1
-        assert results["failed"] == 0
-        
-        # Check output file exists
-        output_file = output_dir / "test.json"
-        assert output_file.exists()
-        
-        # Verify content
-        with open(output_file) as f:
-            data = json.load(f)
-            assert data["detected_type"] == "csv"
-            assert data["data"]["row_count"] == 2
-
-
-def test_process_multiple_files():
+    # Create input file
+    input_file = tmp_path / "test.csv"
+    input_file.write_text(csv_content)
+    
+    # Create output directory
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    # Process
+    processor = FileProcessor(output_dir=output_dir)
+    results = processor.process(input_file)
+    
+    assert results["successful"] == 1
+    assert results["failed"] == 0
+    
+    # Check output file exists
+    output_file = output_dir / "test.json"
+    assert output_file.exists()
+    
+    # Verify content
+    with open(output_file) as f:
+        data = json.load(f)
+        assert data["detected_type"] == "csv"
+        assert data["data"]["row_count"] == 2
+
+
+def test_process_multiple_files(tmp_path):
     """Test processing multiple files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_dir = Path(tmpdir) / "input"
-        input_dir.mkdir()
-        output_dir = Path(tmpdir) / "output"
-        output_dir.mkdir()
-        
-        # Create multiple test files
-        (input_dir / "test1.csv").write_text("a,b\n1,2\n")
-        (input_dir / "test2.txt").write_text("Line 1\nLine 2\n")
-        import json
-        with open(input_dir / "test3.json", 'w') as f:
-            json.dump({"test": "data"}, f)
-        
-        # Process
-        processor = FileProcessor(output_dir=output_dir)
-        results = processor.process(input_dir)
-        
-        assert results["successful"] == 3
-        assert (output_dir / "test1.json").exists()
-        assert (output_dir / "test2.json").exists()
-        assert (output_dir / "test3.json").exists()
-
-
-def test_format_filter():
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    # Create multiple test files
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\nLine 2\n")
+    import json
+    with open(input_dir / "test3.json", 'w') as f:
+        json.dump({"test": "data"}, f)
+    
+    # Process
+    processor = FileProcessor(output_dir=output_dir)
+    results = processor.process(input_dir)
+    
+    assert results["successful"] == 3
+    assert (output_dir / "test1.json").exists()
+    assert (output_dir / "test2.json").exists()
+    assert (output_dir / "test3.json").exists()
+
+
+def test_format_filter(tmp_path):
     """Test format filtering."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_dir = Path(tmpdir) / "input"
-        input_dir.mkdir()
-        output_dir = Path(tmpdir) / "output"
-        output_dir.mkdir()
-        
-        # Create files of different types
-        (input_dir / "test1.csv").write_text("a,b\n1,2\n")
-        (input_dir / "test2.txt").write_text("Line 1\n")
-        
-        # Process with filter
-        processor = FileProcessor(
-            output_dir=output_dir,
-            formats_filter=["csv"]
-        )
-        results = processor.process(input_dir)
-        
-        assert results["successful"] == 1
-        assert (output_dir / "test1.json").exists()
-        assert not (output_dir / "test2.json").exists()
-
-
-def test_master_json():
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    # Create files of different types
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\n")
+    
+    # Process with filter
+    processor = FileProcessor(
+        output_dir=output_dir,
+        formats_filter=["csv"]
+    )
+    results = processor.process(input_dir)
+    
+    assert results["successful"] == 1
+    assert (output_dir / "test1.json").exists()
+    assert not (output_dir / "test2.json").exists()
+
+
+def test_master_json(tmp_path):
     """Test master.json creation."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_dir = Path(tmpdir) / "input"
-        input_dir.mkdir()
-        output_dir = Path(tmpdir) / "output"
-        output_dir.mkdir()
-        
-        # Create test files
-        (input_dir / "test1.csv").write_text("a,b\n1,2\n")
-        (input_dir / "test2.txt").write_text("Line 1\n")
-        
-        # Process and create master
-        processor = FileProcessor(output_dir=output_dir)
-        processor.process(input_dir)
-        processor.create_master_json(output_dir / "master.json")
-        
-        # Verify master.json
-        master_file = output_dir / "master.json"
-        assert master_file.exists()
-        
-        with open(master_file) as f:
-            master_data = json.load(f)
-            assert master_data["total_files"] == 2
-            assert len(master_data["converted_files"]) == 2
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    # Create test files
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\n")
+    
+    # Process and create master
+    processor = FileProcessor(output_dir=output_dir)
+    processor.process(input_dir)
+    processor.create_master_json(output_dir / "master.json")
+    
+    # Verify master.json
+    master_file = output_dir / "master.json"
+    assert master_file.exists()
+    
+    with open(master_file) as f:
+        master_data = json.load(f)
+        assert master_data["total_files"] == 2
+        assert len(master_data["converted_files"]) == 2
 
+
+@pytest.mark.parametrize("parallelism", ["auto", "thread", "process", "serial"])
+def test_parallelism_modes(tmp_path, parallelism):
+    """Test that every execution mode converts files and builds master.json."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\n")
+    
+    processor = FileProcessor(
+        output_dir=output_dir,
+        workers=2,
+        parallelism=parallelism,
+    )
+    results = processor.process(input_dir)
+    processor.create_master_json(output_dir / "master.json")
+    
+    assert results["successful"] == 2
+    with open(output_dir / "master.json") as f:
+        master_data = json.load(f)
+        assert master_data["total_files"] == 2
+        assert len(master_data["converted_files"]) == 2
+
+
+def test_auto_parallelism_routing(tmp_path):
+    """Test that 'auto' mode routes files by their converter's PARALLELISM."""
+    paths = [tmp_path / name for name in ("report.pdf", "data.csv", "notes.txt")]
+    for path in paths:
+        path.write_text("placeholder\n")
+    
+    processor = FileProcessor(output_dir=tmp_path / "output", workers=2)
+    routes = [processor._route(path, None) for path in paths]
+    
+    assert routes == ["cpu", "io", "cpu"]
+
+
+@pytest.mark.parametrize("output_name", ["output", "."])
+def test_output_dir_inside_input_dir(tmp_path, output_name):
+    """Test that JSON written under the input directory is not converted again."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = input_dir / output_name
+    output_dir.mkdir(exist_ok=True)
+    
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\n")
+    
+    processor = FileProcessor(output_dir=output_dir, overwrite=True, parallelism="serial")
+    results = processor.process(input_dir)
+    
+    assert results["successful"] == 2
+    assert sorted(Path(r["output_path"]).name for r in processor.converted_files) == [
+        "test1.json", "test2.json"]
+    with open(output_dir / "test1.json") as f:
+        assert json.load(f)["detected_type"] == "csv"
+
+
+@pytest.mark.parametrize("parallelism", ["auto", "serial"])
+def test_master_json_same_stem(tmp_path, parallelism):
+    """Test that inputs sharing a stem get separate outputs and master.json entries."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    output_dir = tmp_path / "output"
+    
+    (input_dir / "a.csv").write_text("a,b\n1,2\n")
+    (input_dir / "a.txt").write_text("Line 1\n")
+    
+    processor = FileProcessor(output_dir=output_dir, overwrite=True, workers=2,
+                              parallelism=parallelism)
+    results = processor.process(input_dir)
+    processor.create_master_json(output_dir / "master.json")
+    
+    assert results["successful"] == 2
+    outputs = {Path(r["output_path"]).name for r in processor.converted_files}
+    assert outputs == {"a.json", "a_1.json"}
+    
+    # Later edits of the per-file outputs don't leak into master.json
+    (output_dir / "a.json").write_text("{}")
+    processor.create_master_json(output_dir / "master.json")
+    with open(output_dir / "master.json") as f:
+        master_data = json.load(f)
+    assert master_data["total_files"] == 2
+    assert sorted(entry["detected_type"] for entry in master_data["converted_files"]) == ["csv", "txt"]
+
+
+def test_process_pool_does_not_fork(tmp_path, monkeypatch):
+    """Test that the process pool's workers are not forked from the threaded parent."""
+    from concurrent.futures import ProcessPoolExecutor
+    from converter import processor as processor_module
+    
+    contexts = []
+    
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, *args, mp_context=None, **kwargs):
+            contexts.append(mp_context)
+            super().__init__(*args, mp_context=mp_context, **kwargs)
+    
+    monkeypatch.setattr(processor_module, "ProcessPoolExecutor", RecordingExecutor)
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "test1.csv").write_text("a,b\n1,2\n")
+    (input_dir / "test2.txt").write_text("Line 1\n")
+    
+    processor = FileProcessor(output_dir=tmp_path / "output", workers=2)
+    results = processor.process(input_dir)
+    
+    assert results["successful"] == 2
+    assert [context.get_start_method() for context in contexts] in (["forkserver"], ["spawn"])
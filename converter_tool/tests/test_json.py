@@ -1,44 +1,58 @@
 """Tests for JSON converter."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 
+from converter import base_converter
+from converter.base_converter import BaseConverter, IncrementalJSONList
 from converter.converters.json_converter import JsonConverter
 
 
-def test_json_conversion():
+def test_json_conversion(tmp_path):
     """Test JSON file conversion."""
     json_data = {"name": "test", "values": [1, 2, 3]}
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(json_data, f)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.json"
+    temp_path.write_text(json.dumps(json_data))
     
-    try:
-        converter = JsonConverter()
-        result = converter.convert(temp_path)
-        
-        assert result["detected_type"] == "json"
-        assert result["data"] == json_data
-    finally:
-        temp_path.unlink()
+    converter = JsonConverter()
+    result = converter.convert(temp_path)
+    
+    assert result["detected_type"] == "json"
+    assert result["data"] == json_data
 
 
-def test_json_invalid():
+def test_json_invalid(tmp_path):
     """Test invalid JSON handling."""
     invalid_json = '{"name": "test", invalid}'
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write(invalid_json)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.json"
+    temp_path.write_text(invalid_json)
     
-    try:
-        converter = JsonConverter()
-        with pytest.raises(ValueError):
-            converter.convert(temp_path)
-    finally:
-        temp_path.unlink()
-
+    converter = JsonConverter()
+    with pytest.raises(ValueError):
+        converter.convert(temp_path)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("pretty", [True, False])
+def test_save_json_streamed_list(tmp_path, monkeypatch, use_orjson, pretty):
+    """Test that streamed lists are written as the json module would write them."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(base_converter, "orjson", None)
+    records = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "text": "x, y: z"}]
+    data = {"data": {"records": IncrementalJSONList(records), "empty": IncrementalJSONList()}}
+    
+    output_path = tmp_path / "out.json"
+    BaseConverter().save_json(output_path, data, pretty=pretty)
+    
+    plain = {"data": {"records": records, "empty": []}}
+    if pretty:
+        expected = json.dumps(plain, indent=2)
+    else:
+        expected = json.dumps(plain, separators=(",", ":"))
+    assert output_path.read_text() == expected
@@ -0,0 +1,76 @@
+"""Tests for PCAP converter helpers."""
+
+import struct
+import sys
+import types
+
+import pytest
+
+from converter.converters.pcap import PacketColumns, PcapConverter
+
+
+def _write_pcap(path):
+    """Write a one-packet Ethernet capture holding an IPv4/UDP datagram."""
+    udp = struct.pack("!HHHH", 5353, 53, 8, 0)
+    ip = struct.pack("!BBHHHBBH4s4s", 0x45, 0, 20 + len(udp), 0, 0, 64, 17, 0,
+                     bytes([10, 0, 0, 1]), bytes([10, 0, 0, 2])) + udp
+    frame = b"\x00" * 12 + b"\x08\x00" + ip
+    header = struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1)
+    record = struct.pack("<IIII", 1, 0, len(frame), len(frame)) + frame
+    path.write_bytes(header + record)
+    return path
+
+
+def test_packet_columns_fill_missing_fields():
+    """Test that fields missing from some packets are padded with None."""
+    packets = PacketColumns()
+    packets.append({"timestamp": 1.0, "length": 42})
+    packets.append({"timestamp": 2.0, "length": 54, "src_port": 80})
+    packets.append({"timestamp": 3.0, "length": 60})
+    
+    assert len(packets) == 3
+    assert packets.columns == {
+        "timestamp": [1.0, 2.0, 3.0],
+        "length": [42, 54, 60],
+        "src_port": [None, 80, None],
+    }
+
+
+def test_dpkt_packets_have_summary(tmp_path):
+    """Test that dpkt output carries the same keys as the other backends."""
+    pytest.importorskip("dpkt")
+    pcap_path = _write_pcap(tmp_path / "one.pcap")
+    
+    result = PcapConverter()._extract_with_dpkt(pcap_path, max_packets=10)
+    
+    assert result["packets"] == [{
+        "timestamp": 1.0,
+        "length": 42,
+        "summary": "ethernet:ip:udp",
+        "src_ip": "10.0.0.1",
+        "dst_ip": "10.0.0.2",
+        "protocol": 17,
+        "src_port": 5353,
+        "dst_port": 53,
+    }]
+
+
+def test_small_capture_tries_scapy_once(tmp_path, monkeypatch):
+    """Test that a small capture scapy failed on is not handed to scapy again."""
+    for name in ("dpkt", "pyshark", "scapy", "scapy.all"):
+        monkeypatch.setitem(sys.modules, name, types.SimpleNamespace(PcapReader=None))
+    calls = []
+    
+    def failing(backend):
+        def extract(self, file_path, max_packets, columnar=False):
+            calls.append(backend)
+            raise ValueError(f"{backend} failed")
+        return extract
+    
+    for backend in ("dpkt", "scapy", "pyshark"):
+        monkeypatch.setattr(PcapConverter, f"_extract_with_{backend}", failing(backend))
+    pcap_path = _write_pcap(tmp_path / "small.pcap")
+    
+    with pytest.raises(ValueError, match="pyshark failed"):
+        PcapConverter()._extract_data(pcap_path)
+    assert calls == ["dpkt", "scapy", "pyshark"]
@@ -0,0 +1,61 @@
+"""Tests for PDF converter."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from converter.converters import pdf_converter
+from converter.processor import FileProcessor
+
+
+def _write_pdf(path: Path, page_count: int) -> Path:
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % (4 + 2 * i) for i in range(page_count)), page_count),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i in range(page_count):
+        content = b"BT /F1 12 Tf 72 720 Td (page %d) Tj ET" % i
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (5 + 2 * i))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return path
+
+
+def test_pdf_single_file_splits_pages(tmp_path, monkeypatch):
+    """Test that a long PDF given on its own is analysed over several processes by default."""
+    pytest.importorskip("pdfminer")
+    pdf_path = _write_pdf(tmp_path / "long.pdf", 24)
+    
+    pool_sizes = []
+    
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            pool_sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+    
+    monkeypatch.setattr(pdf_converter, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(pdf_converter.os, "cpu_count", lambda: 4)
+    
+    processor = FileProcessor(output_dir=tmp_path / "output", workers=2)
+    results = processor.process(pdf_path)
+    
+    assert results["successful"] == 1
+    assert pool_sizes == [2]
+    
+    converted = pdf_converter.PdfConverter()._extract_data(pdf_path)
+    assert [page["text"] for page in converted["pages"]] == [f"page {i}" for i in range(24)]
@@ -1,6 +1,5 @@
 """Tests for utility functions."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -8,49 +7,175 @@ import pytest
 from converter.utils import detect_file_type, extract_metadata
 
 
-def test_detect_file_type_csv():
+def test_detect_file_type_csv(tmp_path):
     """Test file type detection for CSV."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write("test,data\n")
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.csv"
+    temp_path.write_text("test,data\n")
     
-    try:
-        detected_type, mimetype = detect_file_type(temp_path)
-        assert detected_type == "csv"
-    finally:
-        temp_path.unlink()
+    detected_type, mimetype = detect_file_type(temp_path)
+    assert detected_type == "csv"
 
 
-def test_detect_file_type_json():
+def test_detect_file_type_json(tmp_path):
     """Test file type detection for JSON."""
     import json
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump({"test": "data"}, f)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.json"
+    temp_path.write_text(json.dumps({"test": "data"}))
     
-    try:
-        detected_type, mimetype = detect_file_type(temp_path)
-        assert detected_type == "json"
-    finally:
-        temp_path.unlink()
+    detected_type, mimetype = detect_file_type(temp_path)
+    assert detected_type == "json"
 
 
-def test_extract_metadata():
+def test_extract_metadata(tmp_path):
     """Test metadata extraction."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("test content")
-        temp_path = Path(f.name)
-    
-    try:
-        metadata = extract_metadata(temp_path, include_hashes=True)
-        
-        assert "size" in metadata
-        assert "mtime" in metadata
-        assert "sha256" in metadata
-        assert "sha1" in metadata
-        assert "md5" in metadata
-        assert metadata["size"] > 0
-    finally:
-        temp_path.unlink()
+    temp_path = tmp_path / "test.txt"
+    temp_path.write_text("test content")
+    
+    metadata = extract_metadata(temp_path, include_hashes=True)
+    
+    assert "size" in metadata
+    assert "mtime" in metadata
+    assert "sha256" in metadata
+    assert "sha1" in metadata
+    assert "md5" in metadata
+    assert metadata["size"] > 0
+
+
+def test_extract_metadata_reuses_stat_result(tmp_path):
+    """Test that a stat result from a directory scan is used instead of stat()."""
+    import os
+    
+    temp_path = tmp_path / "test.txt"
+    temp_path.write_text("test content")
+    
+    entry = next(os.scandir(tmp_path))
+    stat_result = entry.stat()
+    temp_path.write_text("longer test content")
+    
+    metadata = extract_metadata(temp_path, include_hashes=False, stat_result=stat_result)
+    assert metadata["size"] == len("test content")
+
+
+def test_detect_file_type_cached(tmp_path):
+    """Test that repeated detection of an unchanged file hits the cache."""
+    from converter.utils import _detect_file_type_cached
+    
+    temp_path = tmp_path / "test.dat"
+    temp_path.write_text("test data\n")
+    
+    first = detect_file_type(temp_path)
+    hits = _detect_file_type_cached.cache_info().hits
+    second = detect_file_type(temp_path)
+    
+    assert first == second
+    assert _detect_file_type_cached.cache_info().hits == hits + 1
 
+
+def test_extract_metadata_hashes_cached(tmp_path):
+    """Test that hashes are recomputed only when the file's size or mtime changes."""
+    import os
+    
+    temp_path = tmp_path / "test.bin"
+    temp_path.write_bytes(b"first")
+    first = extract_metadata(temp_path)
+    
+    mtime_ns = temp_path.stat().st_mtime_ns
+    temp_path.write_bytes(b"other")
+    os.utime(temp_path, ns=(mtime_ns, mtime_ns))
+    assert extract_metadata(temp_path)["sha256"] == first["sha256"]
+    
+    os.utime(temp_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert extract_metadata(temp_path)["sha256"] != first["sha256"]
+
+
+def test_detect_file_type_trusted_extension(tmp_path):
+    """Test that trusted extensions are answered without probing the content."""
+    from converter.utils import _detect_file_type_cached
+    
+    temp_path = tmp_path / "test.pcapng"
+    temp_path.write_text("not really a capture\n")
+    
+    misses = _detect_file_type_cached.cache_info().misses
+    
+    assert detect_file_type(temp_path)[0] == "pcapng"
+    assert detect_file_type(Path("logs.tar.gz"))[0] == "tar"
+    assert _detect_file_type_cached.cache_info().misses == misses
+
+
+def test_calculate_hashes_legacy_digests_opt_in(tmp_path):
+    """Test that SHA1 and MD5 are only computed when requested."""
+    from converter.utils import HASH_ALGORITHMS, calculate_hashes
+    
+    temp_path = tmp_path / "test.bin"
+    temp_path.write_bytes(b"content")
+    
+    default = calculate_hashes(temp_path)
+    assert default["sha256"]
+    assert default["sha1"] == default["md5"] == ""
+    
+    full = calculate_hashes(temp_path, algorithms=HASH_ALGORITHMS)
+    assert full["sha256"] == default["sha256"]
+    assert full["sha1"] and full["md5"]
+
+
+def test_detect_file_type_signature(tmp_path):
+    """Test that magic-byte signatures are recognized regardless of extension."""
+    pcap_path = tmp_path / "capture.bin"
+    pcap_path.write_bytes(b"\xd4\xc3\xb2\xa1" + b"\x00" * 20)
+    pdf_path = tmp_path / "document.dat"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    
+    assert detect_file_type(pcap_path)[0] == "pcap"
+    assert detect_file_type(pdf_path) == ("pdf", "application/pdf")
+
+
+def test_scan_file(tmp_path):
+    """Test that scan_file returns the detected type together with the metadata."""
+    from converter.utils import scan_file
+    
+    temp_path = tmp_path / "data.csv"
+    temp_path.write_text("a,b\n1,2\n")
+    
+    detected_type, mimetype, metadata = scan_file(temp_path)
+    
+    assert (detected_type, mimetype) == detect_file_type(temp_path)
+    assert metadata == extract_metadata(temp_path)
+
+
+def test_calculate_hashes_quick(tmp_path):
+    """Test that quick mode returns only a CRC-32 checksum."""
+    import zlib
+    from converter.utils import calculate_hashes
+    
+    temp_path = tmp_path / "test.bin"
+    temp_path.write_bytes(b"test content")
+    
+    assert calculate_hashes(temp_path, quick=True) == {
+        "crc32": f"{zlib.crc32(b'test content'):08x}"
+    }
+
+
+def test_extract_metadata_without_hashes(tmp_path):
+    """Test that include_hashes=False leaves every digest key out."""
+    temp_path = tmp_path / "test.bin"
+    temp_path.write_bytes(b"test content")
+    
+    metadata = extract_metadata(temp_path, include_hashes=False)
+    
+    assert metadata["size"] == len(b"test content")
+    assert not {"sha256", "sha1", "md5", "crc32"} & set(metadata)
+
+
+def test_extract_metadata_dir(tmp_path):
+    """Test metadata extraction for the files of a directory."""
+    from converter.utils import extract_metadata_dir
+    
+    (tmp_path / "a.txt").write_text("first")
+    (tmp_path / "b.csv").write_text("x,y\n")
+    (tmp_path / "sub").mkdir()
+    
+    results = dict(extract_metadata_dir(tmp_path, include_hashes=True))
+    
+    assert sorted(results) == ["a.txt", "b.csv"]
+    assert results["a.txt"] == extract_metadata(tmp_path / "a.txt")
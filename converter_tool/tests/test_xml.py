@@ -1,6 +1,5 @@
 """Tests for XML converter."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -8,40 +7,48 @@ import pytest
 from converter.converters.xml_converter import XmlConverter
 
 
-def test_xml_conversion():
+def test_xml_conversion(tmp_path):
     """Test XML file conversion."""
     xml_content = '<?xml version="1.0"?><root><item id="1">Value</item></root>'
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(xml_content)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.xml"
+    temp_path.write_text(xml_content)
     
-    try:
-        converter = XmlConverter()
-        result = converter.convert(temp_path)
-        
-        assert result["detected_type"] == "xml"
-        data = result["data"]
-        assert data["tag"] == "root"
-        assert len(data["children"]) == 1
-        assert data["children"][0]["tag"] == "item"
-        assert data["children"][0]["attributes"]["id"] == "1"
-    finally:
-        temp_path.unlink()
-
-
-def test_xml_invalid():
+    converter = XmlConverter()
+    result = converter.convert(temp_path)
+    
+    assert result["detected_type"] == "xml"
+    data = result["data"]
+    assert data["tag"] == "root"
+    assert len(data["children"]) == 1
+    assert data["children"][0]["tag"] == "item"
+    assert data["children"][0]["attributes"]["id"] == "1"
+
+
+def test_xml_invalid(tmp_path):
     """Test invalid XML handling."""
     invalid_xml = '<root><unclosed></root>'
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(invalid_xml)
-        temp_path = Path(f.name)
+    temp_path = tmp_path / "test.xml"
+    temp_path.write_text(invalid_xml)
     
-    try:
-        converter = XmlConverter()
-        with pytest.raises(ValueError):
-            converter.convert(temp_path)
-    finally:
-        temp_path.unlink()
+    converter = XmlConverter()
+    with pytest.raises(ValueError):
+        converter.convert(temp_path)
+
 
+
+def test_xml_mixed_content_and_deep_nesting():
+    """Test text/tail handling and that deep documents don't hit the recursion limit."""
+    converter = XmlConverter()
+    
+    data = converter._extract_data_from_bytes(b'<r> a <b>x</b> tail <c/></r>', "mixed.xml")
+    assert data["text"] == "a"
+    assert data["children"][0] == {"tag": "b", "attributes": {}, "text": "x", "tail": "tail"}
+    assert "tail" not in data["children"][1]
+    
+    depth = 5000
+    data = converter._extract_data_from_bytes(b'<n>' * depth + b'</n>' * depth, "deep.xml")
+    for _ in range(depth - 1):
+        data = data["children"][0]
+    assert "children" not in data
@@ -2,155 +2,541 @@
 Utility functions for file type detection, metadata extraction, and hashing.
 """
 
+import functools
 import hashlib
 import logging
+import mmap
 import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# blake3 is optional: its SIMD tree hash spreads one file over all cores
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
-def detect_file_type(file_path: Path) -> Tuple[str, str]:
+# Extensions trusted without looking at the content (no file I/O); anything
+# else (.gz, .bin, .dat, unknown) goes through content-based detection
+TRUSTED_EXTENSIONS = MappingProxyType({
+    '.evtx': ('evtx', 'application/x-evtx'),
+    '.pcap': ('pcap', 'application/vnd.tcpdump.pcap'),
+    '.pcapng': ('pcapng', 'application/vnd.tcpdump.pcapng'),
+    '.csv': ('csv', 'text/csv'),
+    '.json': ('json', 'application/json'),
+    '.xml': ('xml', 'application/xml'),
+    '.txt': ('txt', 'text/plain'),
+    '.log': ('txt', 'text/plain'),
+    '.pdf': ('pdf', 'application/pdf'),
+    '.docx': ('docx', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+    '.zip': ('zip', 'application/zip'),
+    '.tar': ('tar', 'application/x-tar'),
+    '.tgz': ('tar', 'application/x-gzip'),
+})
+
+# Magika content-type labels mapped to our format types
+MAGIKA_LABEL_TO_TYPE = MappingProxyType({
+    'evtx': 'evtx',
+    'pcap': 'pcap',
+    'pdf': 'pdf',
+    'docx': 'docx',
+    'zip': 'zip',
+    'gzip': 'gzip',
+    'tar': 'tar',
+    'csv': 'csv',
+    'json': 'json',
+    'xml': 'xml',
+    'txt': 'txt',
+})
+
+# python-magic MIME types mapped to our format types
+MIME_TO_TYPE = MappingProxyType({
+    'application/x-evtx': 'evtx',
+    'application/vnd.tcpdump.pcap': 'pcap',
+    'application/vnd.tcpdump.pcapng': 'pcapng',
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'application/zip': 'zip',
+    'application/gzip': 'gzip',
+    'application/x-tar': 'tar',
+    'text/csv': 'csv',
+    'application/json': 'json',
+    'application/xml': 'xml',
+    'text/xml': 'xml',
+    'text/plain': 'txt',
+})
+
+# filetype extensions mapped to our format types
+FILETYPE_EXTENSION_TO_TYPE = MappingProxyType({
+    'evtx': 'evtx',
+    'pcap': 'pcap',
+    'pcapng': 'pcapng',
+})
+
+# Last-resort mapping of file extensions to our format types
+EXTENSION_TO_TYPE = MappingProxyType({
+    '.evtx': 'evtx',
+    '.pcap': 'pcap',
+    '.pcapng': 'pcapng',
+    '.csv': 'csv',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.log': 'txt',
+    '.txt': 'txt',
+    '.pdf': 'pdf',
+    '.docx': 'docx',
+    '.zip': 'zip',
+    '.tar': 'tar',
+    '.gz': 'gzip',
+    '.tgz': 'tar',
+})
+
+# Magic-byte signatures as (signature, offset, detected_type, mimetype), checked
+# in order against the first SIGNATURE_READ_SIZE bytes before any detection
+# library is consulted. Only unambiguous binary/XML headers are listed; text
+# formats (CSV, JSON, logs) are left to the content-based detectors
+FILE_SIGNATURES: Tuple[Tuple[bytes, int, str, str], ...] = (
+    (b'ElfFile\x00', 0, 'evtx', 'application/x-evtx'),
+    (b'\xa1\xb2\xc3\xd4', 0, 'pcap', 'application/vnd.tcpdump.pcap'),
+    (b'\xd4\xc3\xb2\xa1', 0, 'pcap', 'application/vnd.tcpdump.pcap'),
+    (b'\xa1\xb2\x3c\x4d', 0, 'pcap', 'application/vnd.tcpdump.pcap'),  # nanosecond pcap
+    (b'\x4d\x3c\xb2\xa1', 0, 'pcap', 'application/vnd.tcpdump.pcap'),
+    (b'\x0a\x0d\x0d\x0a', 0, 'pcapng', 'application/vnd.tcpdump.pcapng'),
+    (b'%PDF', 0, 'pdf', 'application/pdf'),
+    (b'PK\x03\x04', 0, 'zip', 'application/zip'),
+    (b'\x1f\x8b', 0, 'gzip', 'application/gzip'),
+    (b'ustar', 257, 'tar', 'application/x-tar'),
+    (b'<?xml', 0, 'xml', 'application/xml'),
+    (b'\x7fELF', 0, 'binary', 'application/x-executable'),
+)
+
+# Bytes read from the start of a file to match FILE_SIGNATURES (and for filetype)
+SIGNATURE_READ_SIZE = 512
+
+# Buffer size for files read or written sequentially in full (large buffers mean
+# fewer read()/write() syscalls and better kernel readahead than the 8 KiB default)
+IO_BUFFER_SIZE = 1 << 20
+
+# Slice size fed to each hasher; well above hashlib's 2 KiB GIL-release threshold
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files smaller than this are hashed from a single read() rather than a mapping
+MMAP_MIN_SIZE = 1 << 20
+
+# Files at least this large have their three digests computed in parallel threads
+PARALLEL_HASH_MIN_SIZE = 8 << 20
+
+# Digests every metadata dict carries (empty when not computed), and the ones
+# computed by default; SHA1 and MD5 are opt-in
+HASH_ALGORITHMS = ("sha256", "sha1", "md5")
+DEFAULT_HASH_ALGORITHMS = ("sha256",)
+
+
+def detect_file_type(file_path: Path, stat_result: Optional[os.stat_result] = None) -> Tuple[str, str]:
     """
-    Detect file type using python-magic or filetype, with extension fallback.
+    Detect file type from a trusted extension, else from content using Magika,
+    python-magic or filetype, with extension fallback.
     
+    Trusted extensions (see TRUSTED_EXTENSIONS) are answered without any file
+    I/O. Content-based results are memoized per (path, size, mtime) so repeated probes of an
+    unchanged file skip re-reading its header.
+    
+    Args:
+        file_path: Path to the file
+        stat_result: Already known stat of the file, to skip the stat() call
+        
     Returns:
         Tuple of (detected_type, mimetype)
         detected_type: lowercase extension or generic type (e.g., 'evtx', 'pcap', 'binary')
         mimetype: MIME type string if available, else 'application/octet-stream'
     """
     file_path = Path(file_path)
-    extension = file_path.suffix.lower()
+    trusted = _detect_from_extension(file_path)
+    if trusted:
+        return trusted
     
-    # Try python-magic first
-    try:
-        import magic
-        mime = magic.Magic(mime=True)
-        mimetype = mime.from_file(str(file_path))
-        logger.debug(f"python-magic detected MIME: {mimetype} for {file_path}")
-        
-        # Map common MIME types to our format types
-        mime_to_type = {
-            'application/x-evtx': 'evtx',
-            'application/vnd.tcpdump.pcap': 'pcap',
-            'application/vnd.tcpdump.pcapng': 'pcapng',
-            'application/pdf': 'pdf',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-            'application/zip': 'zip',
-            'application/gzip': 'gzip',
-            'application/x-tar': 'tar',
-            'text/csv': 'csv',
-            'application/json': 'json',
-            'application/xml': 'xml',
-            'text/xml': 'xml',
-            'text/plain': 'txt',
-        }
+    stat = stat_result
+    if stat is None:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return _detect_file_type(file_path)
+    
+    return _detect_file_type_cached(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_file_type_cached(path_str: str, size: int, mtime_ns: int) -> Tuple[str, str]:
+    """Cached wrapper around _detect_file_type; size and mtime_ns invalidate stale entries."""
+    return _detect_file_type(Path(path_str))
+
+
+def detect_file_type_bytes(data: bytes, filename: str) -> Tuple[str, str]:
+    """
+    Detect file type of in-memory content (e.g. an archive member).
+    
+    Args:
+        data: File content
+        filename: Original file name, used for the extension fallback
         
-        detected = mime_to_type.get(mimetype)
-        if detected:
+    Returns:
+        Tuple of (detected_type, mimetype), as for detect_file_type
+    """
+    path = Path(filename)
+    return _detect_from_extension(path) or _detect_file_type(path, content=data)
+
+
+def _detect_from_extension(file_path: Path) -> Optional[Tuple[str, str]]:
+    """Return (detected_type, mimetype) for a trusted extension, else None."""
+    extension = file_path.suffix.lower()
+    if extension == '.gz' and str(file_path).lower().endswith('.tar.gz'):
+        return ('tar', 'application/x-gzip')
+    return TRUSTED_EXTENSIONS.get(extension)
+
+
+def _detect_from_signature(head: bytes) -> Optional[Tuple[str, str]]:
+    """Return (detected_type, mimetype) for a known magic-byte signature, else None."""
+    for signature, offset, detected, mimetype in FILE_SIGNATURES:
+        if head.startswith(signature, offset):
+            # Office documents are ZIP containers; leave those to the detectors
+            # that can tell them apart
+            if detected == 'zip' and b'[Content_Types].xml' in head:
+                return None
             return (detected, mimetype)
+    return None
+
+
+def _read_head(file_path: Path) -> bytes:
+    """Read the first SIGNATURE_READ_SIZE bytes of a file (b'' if it can't be read)."""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(SIGNATURE_READ_SIZE)
+    except OSError:
+        return b''
+
+
+@functools.lru_cache(maxsize=1)
+def _get_magic():
+    """Load the libmagic database once per process (None if python-magic is not installed)."""
+    try:
+        import magic
     except ImportError:
         logger.debug("python-magic not available, falling back to extension")
-    except Exception as e:
-        logger.warning(f"python-magic error: {e}, falling back to extension")
+        return None
+    return magic.Magic(mime=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_magika():
+    """Load the Magika model once per process (None if magika is not installed)."""
+    try:
+        from magika import Magika
+    except ImportError:
+        logger.debug("magika not available, falling back to python-magic")
+        return None
+    return Magika()
+
+
+def _magika_label(result) -> Optional[Tuple[str, str]]:
+    """Extract (label, mimetype) from a Magika result across API versions."""
+    output = result.output
+    label = getattr(output, 'label', None) or getattr(output, 'ct_label', None)
+    if label is None:
+        return None
+    return (str(label), output.mime_type)
+
+
+def _detect_file_type(file_path: Path, content: Optional[bytes] = None) -> Tuple[str, str]:
+    """
+    Detect file type without caching (see detect_file_type).
+    
+    When content is given it is probed instead of reading file_path, whose
+    name is then only used for the extension fallback. Known magic-byte
+    signatures in the file's first bytes are answered from FILE_SIGNATURES
+    without loading any detection library.
+    """
+    extension = file_path.suffix.lower()
+    
+    head = content[:SIGNATURE_READ_SIZE] if content is not None else _read_head(file_path)
+    signature = _detect_from_signature(head)
+    if signature:
+        return signature
+    
+    # Try Magika first: more accurate than libmagic signatures on text formats
+    magika = _get_magika()
+    if magika is not None:
+        try:
+            if content is not None:
+                result = magika.identify_bytes(content)
+            else:
+                result = magika.identify_path(file_path)
+            label = _magika_label(result)
+            if label:
+                logger.debug("magika detected %s (%s) for %s", label[0], label[1], file_path)
+                detected = MAGIKA_LABEL_TO_TYPE.get(label[0])
+                if detected:
+                    return (detected, label[1])
+        except Exception as e:
+            logger.warning("magika error: %s, falling back to python-magic", e)
+    
+    # Then python-magic (its database is loaded once per process, see _get_magic)
+    mime = _get_magic()
+    if mime is not None:
+        try:
+            if content is not None:
+                mimetype = mime.from_buffer(content)
+            else:
+                mimetype = mime.from_file(str(file_path))
+            logger.debug("python-magic detected MIME: %s for %s", mimetype, file_path)
+            
+            detected = MIME_TO_TYPE.get(mimetype)
+            if detected:
+                return (detected, mimetype)
+        except Exception as e:
+            logger.warning("python-magic error: %s, falling back to extension", e)
     
     # Try filetype library
     try:
         import filetype
-        kind = filetype.guess(str(file_path))
+        # filetype only looks at the first 261 bytes, which are already in head
+        kind = filetype.guess(head)
         if kind:
             mimetype = kind.mime
-            logger.debug(f"filetype detected MIME: {mimetype} for {file_path}")
-            
-            # Map filetype extensions to our types
-            ext_to_type = {
-                '.evtx': 'evtx',
-                '.pcap': 'pcap',
-                '.pcapng': 'pcapng',
-            }
+            logger.debug("filetype detected MIME: %s for %s", mimetype, file_path)
             
-            detected = ext_to_type.get(f".{kind.extension}")
+            detected = FILETYPE_EXTENSION_TO_TYPE.get(kind.extension)
             if detected:
                 return (detected, mimetype)
     except ImportError:
         logger.debug("filetype not available, using extension fallback")
     except Exception as e:
-        logger.warning(f"filetype error: {e}, using extension fallback")
+        logger.warning("filetype error: %s, using extension fallback", e)
     
     # Extension-based fallback
-    extension_map = {
-        '.evtx': 'evtx',
-        '.pcap': 'pcap',
-        '.pcapng': 'pcapng',
-        '.csv': 'csv',
-        '.json': 'json',
-        '.xml': 'xml',
-        '.log': 'txt',
-        '.txt': 'txt',
-        '.pdf': 'pdf',
-        '.docx': 'docx',
-        '.zip': 'zip',
-        '.tar': 'tar',
-        '.gz': 'gzip',
-        '.tgz': 'tar',
-    }
-    
-    # Handle .tar.gz
-    if file_path.suffixes[-2:] == ['.tar', '.gz']:
+    if str(file_path).lower().endswith('.tar.gz'):
         detected = 'tar'
         mimetype = 'application/x-gzip'
     else:
-        detected = extension_map.get(extension, 'binary')
+        detected = EXTENSION_TO_TYPE.get(extension, 'binary')
         mimetype = 'application/octet-stream'
     
     return (detected, mimetype)
 
 
-def calculate_hashes(file_path: Path) -> Dict[str, str]:
+def _new_blake3():
+    """Return a multithreaded BLAKE3 hasher, or None if blake3 isn't installed."""
+    if blake3 is None:
+        return None
+    return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+
+def _empty_hashes() -> Dict[str, str]:
+    """Digest keys calculate_hashes() produces, all set to ''."""
+    hashes = dict.fromkeys(HASH_ALGORITHMS, "")
+    if blake3 is not None:
+        hashes["blake3"] = ""
+    return hashes
+
+
+def calculate_hashes(file_path: Path, algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS,
+                     quick: bool = False) -> Dict[str, str]:
     """
-    Calculate SHA256, SHA1, and MD5 hashes of a file.
+    Calculate the requested digests of a file (SHA256 by default; SHA1 and MD5
+    on request), plus BLAKE3 when the blake3 package is installed.
+    
+    The file is read in a single pass. Files of at least MMAP_MIN_SIZE are
+    memory-mapped (with sequential-access advice for kernel readahead) and
+    each slice of the mapping is fed to every hasher without copying;
+    smaller files are read in one call, where setting up a mapping would cost
+    more than it saves. Files that can't be mapped are read into one reused
+    buffer instead. A mapping is handed to BLAKE3 in one update, letting its
+    thread pool split the tree over all cores.
     
     Args:
         file_path: Path to the file
-        
+        algorithms: Digests to compute, out of HASH_ALGORITHMS
+        quick: Only compute a CRC-32 checksum, for change detection where a
+            cryptographic digest isn't needed (far cheaper per byte)
+            
     Returns:
-        Dictionary with 'sha256', 'sha1', and 'md5' keys
+        Dictionary with 'sha256', 'sha1', and 'md5' keys ('' unless requested)
+        and a 'blake3' key (if blake3 is installed); with quick, only a 'crc32' key
     """
-    sha256_hash = hashlib.sha256()
-    sha1_hash = hashlib.sha1()
-    md5_hash = hashlib.md5()
+    if quick:
+        try:
+            return {"crc32": _crc32_file(file_path)}
+        except Exception as e:
+            logger.error(f"Error calculating checksum for {file_path}: {e}")
+            return {"crc32": ""}
     
     try:
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                sha256_hash.update(chunk)
-                sha1_hash.update(chunk)
-                md5_hash.update(chunk)
+        return _hash_file(file_path, tuple(algorithms))
     except Exception as e:
         logger.error(f"Error calculating hashes for {file_path}: {e}")
-        return {"sha256": "", "sha1": "", "md5": ""}
+        return _empty_hashes()
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_file_cached(path_str: str, size: int, mtime_ns: int,
+                      algorithms: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Cached wrapper around _hash_file; size and mtime_ns invalidate stale entries.
     
-    return {
-        "sha256": sha256_hash.hexdigest(),
-        "sha1": sha1_hash.hexdigest(),
-        "md5": md5_hash.hexdigest(),
-    }
+    Failures raise and so are not cached. Callers must copy the returned dict.
+    """
+    return _hash_file(path_str, algorithms)
 
 
-def extract_metadata(file_path: Path, include_hashes: bool = True) -> Dict:
+def _hash_file(file_path: Union[str, Path], algorithms: Tuple[str, ...]) -> Dict[str, str]:
+    """Hash a file as described in calculate_hashes, raising on I/O errors."""
+    if not algorithms and blake3 is None:
+        return _empty_hashes()
+    
+    # Unbuffered: every read below is already a single large read
+    with open(file_path, 'rb', buffering=0) as f:
+        st = os.fstat(f.fileno())
+        if S_ISREG(st.st_mode) and st.st_size < MMAP_MIN_SIZE:
+            # Small files (the common case) take one read and one-shot digests
+            return calculate_hashes_bytes(f.readall(), algorithms)
+        
+        hashers = tuple(getattr(hashlib, name)() for name in algorithms)
+        b3 = _new_blake3()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Unmappable file (e.g. a pipe), read it instead
+            mm = None
+            _update_from_reads(hashers if b3 is None else hashers + (b3,), f)
+        
+        if mm is not None:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with mm, memoryview(mm) as mv:
+                if b3 is not None:
+                    b3.update(mv)
+                if (len(hashers) > 1 and len(mv) >= PARALLEL_HASH_MIN_SIZE
+                        and (os.cpu_count() or 1) > 1):
+                    _update_concurrently(hashers, mv)
+                else:
+                    _update_chunks(hashers, mv)
+    
+    hashes = _empty_hashes()
+    for name, h in zip(algorithms, hashers):
+        hashes[name] = h.hexdigest()
+    if b3 is not None:
+        hashes["blake3"] = b3.hexdigest()
+    return hashes
+
+
+class _Crc32:
+    """zlib.crc32 behind the update()/hexdigest() interface of hashlib objects."""
+    
+    def __init__(self):
+        self.value = 0
+    
+    def update(self, data) -> None:
+        self.value = zlib.crc32(data, self.value)
+    
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+def _crc32_file(file_path: Path) -> str:
+    """CRC-32 of a file as 8 hex digits."""
+    crc = _Crc32()
+    with open(file_path, 'rb', buffering=0) as f:
+        _update_from_reads((crc,), f)
+    return crc.hexdigest()
+
+
+def _update_from_reads(hashers: Sequence, f) -> None:
+    """Feed a file's remaining content to the hashers through one reused buffer."""
+    with memoryview(bytearray(HASH_CHUNK_SIZE)) as mv:
+        while True:
+            n = f.readinto(mv)
+            if not n:
+                break
+            with mv[:n] as chunk:
+                for h in hashers:
+                    h.update(chunk)
+
+
+def _update_chunks(hashers: Sequence, mv: memoryview) -> None:
+    """Feed a buffer to the hashers in HASH_CHUNK_SIZE slices, without copying."""
+    for start in range(0, len(mv), HASH_CHUNK_SIZE):
+        with mv[start:start + HASH_CHUNK_SIZE] as chunk:
+            for h in hashers:
+                h.update(chunk)
+
+
+def _update_concurrently(hashers: Sequence, mv: memoryview) -> None:
+    """
+    Feed a buffer to each hasher in its own thread.
+    
+    hashlib releases the GIL while hashing large updates, so the digests run
+    side by side on separate cores instead of one after another. Each thread
+    walks the whole buffer, so no per-chunk synchronization is needed. The
+    threads are started per call rather than kept in a module-level pool, which
+    would not survive the fork into process-pool workers.
+    """
+    with ThreadPoolExecutor(max_workers=len(hashers) - 1) as executor:
+        futures = [executor.submit(_update_chunks, (h,), mv) for h in hashers[1:]]
+        _update_chunks(hashers[:1], mv)
+        for future in futures:
+            future.result()
+
+
+def calculate_hashes_bytes(data: bytes,
+                           algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS) -> Dict[str, str]:
+    """
+    Calculate the hashes of in-memory content (see calculate_hashes).
+    
+    Args:
+        data: Content to hash
+        algorithms: Digests to compute, out of HASH_ALGORITHMS
+        
+    Returns:
+        Dictionary with the same keys as calculate_hashes()
+    """
+    hashes = _empty_hashes()
+    for name in algorithms:
+        hashes[name] = getattr(hashlib, name)(data).hexdigest()
+    b3 = _new_blake3()
+    if b3 is not None:
+        b3.update(data)
+        hashes["blake3"] = b3.hexdigest()
+    return hashes
+
+
+def extract_metadata(file_path: Path, include_hashes: bool = True, *,
+                     stat_result: Optional[os.stat_result] = None,
+                     hash_algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS) -> Dict:
     """
     Extract file metadata including size, modification time, and hashes.
     
+    Hashes of regular files are memoized per (path, size, mtime), so a file
+    converted again in the same process is not re-read while unchanged.
+    
     Args:
         file_path: Path to the file
-        include_hashes: Whether to calculate file hashes (can be slow for large files)
+        include_hashes: Whether to calculate file hashes (can be slow for large
+            files); without them the file isn't read and no digest keys are set
+        stat_result: Already known stat of the file (e.g. from a directory scan),
+            to skip the stat() call
+        hash_algorithms: Digests to compute, out of HASH_ALGORITHMS
         
     Returns:
         Dictionary with metadata
     """
-    file_path = Path(file_path)
-    stat = file_path.stat()
+    # Plain path string and os.stat(): no Path object or method dispatch per file
+    path_str = os.fspath(file_path)
+    stat = stat_result if stat_result is not None else os.stat(path_str)
     
     metadata = {
         "size": stat.st_size,
@@ -158,14 +544,60 @@ def extract_metadata(file_path: Path, include_hashes: bool = True) -> Dict:
         "mtime_iso": None,  # Will be set by the converter
     }
     
-    if include_hashes:
-        metadata.update(calculate_hashes(file_path))
-    else:
-        metadata.update({"sha256": "", "sha1": "", "md5": ""})
+    if include_hashes and S_ISREG(stat.st_mode):
+        try:
+            metadata.update(_hash_file_cached(path_str, stat.st_size, stat.st_mtime_ns,
+                                              tuple(hash_algorithms)))
+        except Exception as e:
+            logger.error(f"Error calculating hashes for {path_str}: {e}")
+            metadata.update(_empty_hashes())
+    elif include_hashes:
+        metadata.update(calculate_hashes(path_str, hash_algorithms))
     
     return metadata
 
 
+def extract_metadata_dir(dir_path: Path, include_hashes: bool = False) -> List[Tuple[str, Dict]]:
+    """
+    Extract the metadata of every regular file directly inside a directory.
+    
+    Uses os.scandir, whose entries carry their stat results, so each file is
+    stat()ed once instead of once by the listing and again for its metadata.
+    
+    Args:
+        dir_path: Directory to list (not recursed into)
+        include_hashes: Whether to calculate file hashes
+        
+    Returns:
+        List of (file name, metadata) tuples, in directory order
+    """
+    results = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                results.append((entry.name, extract_metadata(entry.path, include_hashes,
+                                                             stat_result=entry.stat())))
+    return results
+
+
+def scan_file(file_path: Path, include_hashes: bool = True) -> Tuple[str, str, Dict]:
+    """
+    Detect a file's type and extract its metadata from a single stat() call.
+    
+    Args:
+        file_path: Path to the file
+        include_hashes: Whether to calculate file hashes
+        
+    Returns:
+        Tuple of (detected_type, mimetype, metadata)
+    """
+    file_path = Path(file_path)
+    stat_result = file_path.stat()
+    detected_type, mimetype = detect_file_type(file_path, stat_result)
+    metadata = extract_metadata(file_path, include_hashes, stat_result=stat_result)
+    return detected_type, mimetype, metadata
+
+
 def ensure_output_dir(output_path: Path) -> None:
     """Ensure the output directory exists."""
     output_path.parent.mkdir(parents=True, exist_ok=True)